@@ -1,14 +1,18 @@
 import asyncio
-import aiosqlite
+
+from src._dbutil import open_db
 
 async def debug_db():
-    async with aiosqlite.connect("data/leads.db") as db:
-        db.row_factory = aiosqlite.Row
+    db = await open_db("data/leads.db")
+    try:
+        # Plain tuples — no Row allocation per row for a three-column dump.
         async with db.execute("SELECT chain, token_address, token_symbol FROM tokens ORDER BY id DESC LIMIT 10") as cursor:
             rows = await cursor.fetchall()
             print(f"Found {len(rows)} tokens in DB:")
-            for row in rows:
-                print(f" - {row['chain']}/{row['token_symbol']} ({row['token_address']})")
+            for chain, token_address, token_symbol in rows:
+                print(f" - {chain}/{token_symbol} ({token_address})")
+    finally:
+        await db.close()
 
 if __name__ == "__main__":
     asyncio.run(debug_db())
@@ -0,0 +1,26 @@
+"""
+Shared connection helper for the maintenance scripts (clear_db, debug_db).
+"""
+
+from __future__ import annotations
+
+import aiosqlite
+
+
+async def open_db(db_path: str) -> aiosqlite.Connection:
+    """
+    Open an aiosqlite connection with the PRAGMAs the scripts need.
+
+    Gives clear_db.py and debug_db.py one place for WAL + busy_timeout +
+    foreign_keys setup instead of each script repeating (or forgetting) it.
+    The caller is responsible for closing the connection.
+    """
+    conn = await aiosqlite.connect(db_path)
+    await conn.executescript(
+        """
+        PRAGMA journal_mode=WAL;
+        PRAGMA foreign_keys=ON;
+        PRAGMA busy_timeout=5000;
+        """
+    )
+    return conn
@@ -5,31 +5,75 @@ Configuration module — loads and validates all environment variables.
 from __future__ import annotations
 
 import os
-from dataclasses import dataclass, field
+import pickle
+from dataclasses import dataclass, field, fields
+from collections.abc import Mapping
 from pathlib import Path
+from types import MappingProxyType
 from typing import Optional
 
-from dotenv import load_dotenv
+from dotenv import dotenv_values, load_dotenv
 
-# Load .env from project root
 _PROJECT_ROOT = Path(__file__).resolve().parent.parent
-load_dotenv(_PROJECT_ROOT / ".env")
+_ENV_PATH = _PROJECT_ROOT / ".env"
+_ENV_CACHE_PATH = _PROJECT_ROOT / "data" / ".env.cache.pkl"
+
+
+def _load_env_cached() -> None:
+    """
+    Load .env from the project root, skipping the line-by-line dotenv parser
+    when a pickled snapshot keyed by the file's mtime is still current.
+    """
+    try:
+        mtime = _ENV_PATH.stat().st_mtime_ns
+    except OSError:
+        return  # No .env present — nothing to load.
+
+    try:
+        with open(_ENV_CACHE_PATH, "rb") as fh:
+            cached_mtime, values = pickle.load(fh)
+        if cached_mtime == mtime:
+            for key, value in values.items():
+                # Mirror load_dotenv semantics: real env vars win over .env.
+                os.environ.setdefault(key, value)
+            return
+    except (OSError, pickle.PickleError, EOFError, ValueError):
+        pass
+
+    load_dotenv(_ENV_PATH)
+    values = {k: v for k, v in dotenv_values(_ENV_PATH).items() if v is not None}
+    try:
+        _ENV_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with open(_ENV_CACHE_PATH, "wb") as fh:
+            pickle.dump((mtime, values), fh, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass  # Cache is best-effort; .env was loaded either way.
+
+
+_load_env_cached()
+
+# Bound once after .env is merged in: every Config field default goes
+# straight to the environment mapping's get, skipping the os.getenv wrapper
+# (module attribute lookup + default-argument plumbing) per field. A frozen
+# dict(os.environ) snapshot would be marginally faster still, but it breaks
+# callers that inject variables after import (patch.dict in the tests).
+_getenv = os.environ.get
 
 
 def _require(key: str) -> str:
     """Return env var or raise with a helpful message."""
-    val = os.getenv(key)
+    val = _getenv(key)
     if not val:
         raise EnvironmentError(f"Missing required environment variable: {key}")
     return val
 
 
 def _optional(key: str, default: str = "") -> str:
-    return os.getenv(key, default)
+    return _getenv(key, default)
 
 
 def _optional_bool(key: str, default: bool = False) -> bool:
-    raw = os.getenv(key)
+    raw = _getenv(key)
     if raw is None:
         return default
     normalized = raw.strip().lower()
@@ -43,7 +87,7 @@ def _optional_bool(key: str, default: bool = False) -> bool:
 
 
 def _optional_int(key: str, default: Optional[int] = None) -> Optional[int]:
-    raw = os.getenv(key)
+    raw = _getenv(key)
     if raw is None or raw == "":
         return default
     try:
@@ -55,7 +99,7 @@ def _optional_int(key: str, default: Optional[int] = None) -> Optional[int]:
 
 
 def _optional_csv_tuple(key: str, default: tuple[str, ...]) -> tuple[str, ...]:
-    raw = os.getenv(key)
+    raw = _getenv(key)
     if raw is None or not raw.strip():
         return default
     parsed = tuple(part.strip().lower() for part in raw.split(",") if part.strip())
@@ -64,9 +108,13 @@ def _optional_csv_tuple(key: str, default: tuple[str, ...]) -> tuple[str, ...]:
     return parsed
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, eq=True)
 class Config:
-    """Immutable application configuration."""
+    """
+    Application configuration. Treated as immutable after construction;
+    a plain slotted dataclass keeps attribute access on the hot paths
+    cheaper than frozen's __setattr__ indirection.
+    """
 
     # ── Telegram Bot (python-telegram-bot) ──────────────────────
     telegram_bot_token: str = field(default_factory=lambda: _require("TELEGRAM_BOT_TOKEN"))
@@ -139,6 +187,15 @@ class Config:
     dexscreener_fair_chain_sampling: bool = field(
         default_factory=lambda: _optional_bool("DEXSCREENER_FAIR_CHAIN_SAMPLING", True)
     )
+    lead_pipeline_concurrency: int = field(
+        default_factory=lambda: _optional_int("LEAD_PIPELINE_CONCURRENCY", 8) or 8
+    )
+    seen_cache_size: int = field(
+        default_factory=lambda: _optional_int("SEEN_CACHE_SIZE", 10000) or 10000
+    )
+    health_log_every_polls: int = field(
+        default_factory=lambda: _optional_int("HEALTH_LOG_EVERY_POLLS", 10) or 10
+    )
     notification_retry_max_attempts: int = field(
         default_factory=lambda: _optional_int("NOTIFICATION_RETRY_MAX_ATTEMPTS", 5) or 5
     )
@@ -161,6 +218,21 @@ class Config:
         )
     )
 
+    # ── Memoized derived state (not part of the value) ──────────
+    _hash: Optional[int] = field(default=None, init=False, repr=False, compare=False)
+    _explorer_configs: Mapping[str, dict[str, str]] = field(
+        init=False, repr=False, compare=False
+    )
+    # Precomputed for O(1) chain membership checks on the discovery hot path.
+    tracked_chains_set: frozenset[str] = field(init=False, repr=False, compare=False)
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = hash(
+                tuple(getattr(self, f.name) for f in fields(self) if f.compare)
+            )
+        return self._hash
+
     def __post_init__(self) -> None:
         if self.poll_interval_seconds <= 0:
             raise EnvironmentError("POLL_INTERVAL_SECONDS must be > 0")
@@ -170,6 +242,12 @@ class Config:
             raise EnvironmentError("DEXSCREENER_PAIR_FETCH_CONCURRENCY must be > 0")
         if self.dexscreener_max_profiles_per_poll <= 0:
             raise EnvironmentError("DEXSCREENER_MAX_PROFILES_PER_POLL must be > 0")
+        if self.lead_pipeline_concurrency <= 0:
+            raise EnvironmentError("LEAD_PIPELINE_CONCURRENCY must be > 0")
+        if self.seen_cache_size <= 0:
+            raise EnvironmentError("SEEN_CACHE_SIZE must be > 0")
+        if self.health_log_every_polls <= 0:
+            raise EnvironmentError("HEALTH_LOG_EVERY_POLLS must be > 0")
         if self.notification_retry_max_attempts <= 0:
             raise EnvironmentError("NOTIFICATION_RETRY_MAX_ATTEMPTS must be > 0")
         if self.notification_retry_base_delay_seconds <= 0:
@@ -189,6 +267,24 @@ class Config:
         if not self.tracked_chains:
             raise EnvironmentError("TRACKED_CHAINS must not be empty")
 
+        self.tracked_chains_set = frozenset(self.tracked_chains)
+        self._explorer_configs = MappingProxyType(
+            {
+                "ethereum": {
+                    "api_url": "https://api.etherscan.io/api",
+                    "api_key": self.etherscan_api_key,
+                },
+                "bsc": {
+                    "api_url": "https://api.bscscan.com/api",
+                    "api_key": self.bscscan_api_key,
+                },
+                "base": {
+                    "api_url": "https://api.basescan.org/api",
+                    "api_key": self.basescan_api_key,
+                },
+            }
+        )
+
     @property
     def telegram_admin_credentials_present(self) -> bool:
         return bool(self.telegram_api_id and self.telegram_api_hash and self.telegram_phone)
@@ -199,18 +295,6 @@ class Config:
 
     # ── Explorer base URLs mapped by chain ──────────────────────
     @property
-    def explorer_configs(self) -> dict[str, dict[str, str]]:
-        return {
-            "ethereum": {
-                "api_url": "https://api.etherscan.io/api",
-                "api_key": self.etherscan_api_key,
-            },
-            "bsc": {
-                "api_url": "https://api.bscscan.com/api",
-                "api_key": self.bscscan_api_key,
-            },
-            "base": {
-                "api_url": "https://api.basescan.org/api",
-                "api_key": self.basescan_api_key,
-            },
-        }
+    def explorer_configs(self) -> Mapping[str, dict[str, str]]:
+        # Built once in __post_init__ and frozen — callers read this per token.
+        return self._explorer_configs
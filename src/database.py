@@ -4,10 +4,13 @@ SQLite persistence layer using aiosqlite.
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import sqlite3
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Optional
+from typing import NamedTuple, Optional
 
 import aiosqlite
 
@@ -15,6 +18,34 @@ from .models import LeadRecord, TelegramAdmin
 
 logger = logging.getLogger("dexbot.database")
 
+
+class RecentLead(NamedTuple):
+    """Narrow projection of a lead row for listings/diagnostics."""
+
+    chain: str
+    token_symbol: str
+    token_address: str
+    dexscreener_url: str
+    pair_created_at: str
+    discovered_at: str
+    telegram: Optional[str]
+    twitter: Optional[str]
+    website: Optional[str]
+    deployer_wallet: Optional[str]
+
+# Per-connection PRAGMAs (journal_mode persists in the file, the rest reset
+# on every new connection, so they must run from connect(), not the DDL).
+# synchronous=NORMAL is safe under WAL and halves fsyncs per commit.
+CONNECTION_PRAGMAS_SQL = """
+PRAGMA journal_mode=WAL;
+PRAGMA synchronous=NORMAL;
+PRAGMA foreign_keys=ON;
+PRAGMA temp_store=MEMORY;
+PRAGMA mmap_size=268435456;
+PRAGMA cache_size=-64000;
+PRAGMA busy_timeout=5000;
+"""
+
 SCHEMA_SQL = """
 CREATE TABLE IF NOT EXISTS tokens (
     id              INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -25,13 +56,19 @@ CREATE TABLE IF NOT EXISTS tokens (
     pair_address    TEXT    NOT NULL,
     dexscreener_url TEXT    NOT NULL,
     pair_created_at TEXT    NOT NULL,
-    discovered_at   TEXT    NOT NULL DEFAULT (datetime('now')),
+    -- Python isoformat shape: discovered_at is ordered lexicographically,
+    -- so every writer must produce the same "YYYY-MM-DDTHH:MM:SS…" format
+    -- (datetime('now') uses a space separator, which sorts differently).
+    discovered_at   TEXT    NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%S+00:00', 'now')),
     notified        INTEGER NOT NULL DEFAULT 0,
     notification_attempts INTEGER NOT NULL DEFAULT 0,
     last_notify_error TEXT,
     next_retry_at   TEXT,
     dead_letter     INTEGER NOT NULL DEFAULT 0,
-    UNIQUE(chain, token_address)
+    UNIQUE(chain, token_address),
+    -- Addresses are canonicalized at ingestion (LeadRecord validator); this
+    -- guards against any write path regressing to mixed case.
+    CHECK (token_address = lower(token_address))
 );
 
 CREATE TABLE IF NOT EXISTS socials (
@@ -59,65 +96,137 @@ CREATE TABLE IF NOT EXISTS wallets (
 
 CREATE INDEX IF NOT EXISTS idx_tokens_chain_address ON tokens(chain, token_address);
 CREATE INDEX IF NOT EXISTS idx_tokens_created ON tokens(pair_created_at);
+CREATE INDEX IF NOT EXISTS idx_tokens_discovered ON tokens(discovered_at DESC);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_admins_token_username ON admins(token_id, username);
+-- Child-side FK indexes so cascade deletes and per-token joins don't scan.
+CREATE INDEX IF NOT EXISTS idx_admins_token ON admins(token_id);
+CREATE INDEX IF NOT EXISTS idx_socials_token ON socials(token_id);
+CREATE INDEX IF NOT EXISTS idx_wallets_token ON wallets(token_id);
 """
 
 
 class Database:
     """Async SQLite database manager."""
 
+    # Canonical SQL for the hot dedup/insert path. Keeping one string object
+    # per statement lets SQLite reuse its prepared-statement cache instead of
+    # reparsing a fresh literal on every call.
+    _SQL_TOKEN_EXISTS = "SELECT 1 FROM tokens WHERE chain = ? AND token_address = ?"
+    _SQL_INSERT_TOKEN = """INSERT OR IGNORE INTO tokens
+               (chain, token_address, token_name, token_symbol,
+                pair_address, dexscreener_url, pair_created_at, discovered_at, notified,
+                notification_attempts, last_notify_error, next_retry_at, dead_letter)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, 0, 0, NULL, NULL, 0)"""
+
+    # Registrations queue for up to this long / this many rows before one
+    # executemany under a single commit flushes them — one fsync per batch
+    # of skipped tokens instead of one per token.
+    _REGISTER_FLUSH_DELAY = 0.05
+    _REGISTER_FLUSH_MAX_ROWS = 64
+
+    # Process-wide instances memoized by path — see Database.instance().
+    _instances: dict[str, "Database"] = {}
+
+    @classmethod
+    def instance(cls, db_path: str) -> "Database":
+        """
+        Return the shared Database for ``db_path``, creating it on first use.
+        Reusing one instance per path means the PRAGMA + schema round-trip in
+        connect() runs once per process instead of once per caller.
+        """
+        db = cls._instances.get(db_path)
+        if db is None:
+            db = cls._instances[db_path] = cls(db_path)
+        return db
+
     def __init__(self, db_path: str):
         self._db_path = db_path
         self._conn: Optional[aiosqlite.Connection] = None
+        # Direct synchronous connection for the tiny hot-path reads; WAL mode
+        # means readers never block behind the writer, and skipping aiosqlite's
+        # worker thread removes a context switch per query.
+        self._read_conn: Optional[sqlite3.Connection] = None
+        # Write-coalescing state for register_token (see _register_flusher).
+        self._pending_registrations: list[tuple] = []
+        self._pending_registration_keys: set[tuple[str, str]] = set()
+        self._registration_event = asyncio.Event()
+        self._flush_task: Optional[asyncio.Task] = None
+        # Serializes writers (transaction() callers, the register flusher,
+        # batch registration) so no task can issue BEGIN IMMEDIATE while
+        # another writer's transaction is still open.
+        self._txn_lock = asyncio.Lock()
 
     async def connect(self) -> None:
         """Open connection and initialize schema."""
         # Ensure parent directory exists
         Path(self._db_path).parent.mkdir(parents=True, exist_ok=True)
 
-        self._conn = await aiosqlite.connect(self._db_path)
+        # A larger statement cache keeps every hot INSERT/SELECT parsed and
+        # planned once per connection; the default (128) can thrash once the
+        # batch paths and per-poll queries are all in play.
+        self._conn = await aiosqlite.connect(self._db_path, cached_statements=256)
         self._conn.row_factory = aiosqlite.Row
-        await self._conn.execute("PRAGMA journal_mode=WAL")
-        await self._conn.execute("PRAGMA foreign_keys=ON")
-        await self._conn.executescript(SCHEMA_SQL)
+        # One round-trip for all startup PRAGMAs plus the schema.
+        await self._conn.executescript(CONNECTION_PRAGMAS_SQL + SCHEMA_SQL)
         await self._ensure_schema_compatibility()
         await self._conn.commit()
+
+        # In-memory databases are private to their connection, so the shared
+        # read connection only applies to file-backed databases.
+        if self._db_path != ":memory:":
+            self._read_conn = sqlite3.connect(self._db_path, check_same_thread=False)
+            self._read_conn.execute("PRAGMA query_only=1")
+            self._read_conn.execute("PRAGMA busy_timeout=5000")
+
+        self._flush_task = asyncio.create_task(self._register_flusher())
         logger.info("Database connected at %s", self._db_path)
 
+    def _require_conn(self) -> aiosqlite.Connection:
+        """
+        Return the live connection, bound once per call so method bodies use
+        a local instead of repeated self._conn attribute loads. Unlike the
+        old asserts this check survives python -O.
+        """
+        conn = self._conn
+        if conn is None:
+            raise RuntimeError("Database is not connected — call connect() first")
+        return conn
+
     async def _ensure_schema_compatibility(self) -> None:
-        assert self._conn
-        cursor = await self._conn.execute("PRAGMA table_info(tokens)")
+        conn = self._require_conn()
+        cursor = await conn.execute("PRAGMA table_info(tokens)")
         rows = await cursor.fetchall()
         columns = {row["name"] for row in rows}
         upgraded_legacy_notify_model = False
         if "notified" not in columns:
-            await self._conn.execute(
+            await conn.execute(
                 "ALTER TABLE tokens ADD COLUMN notified INTEGER NOT NULL DEFAULT 0"
             )
             logger.info("Applied DB migration: added tokens.notified")
             upgraded_legacy_notify_model = True
         if "notification_attempts" not in columns:
-            await self._conn.execute(
+            await conn.execute(
                 "ALTER TABLE tokens ADD COLUMN notification_attempts INTEGER NOT NULL DEFAULT 0"
             )
             upgraded_legacy_notify_model = True
         if "last_notify_error" not in columns:
-            await self._conn.execute(
+            await conn.execute(
                 "ALTER TABLE tokens ADD COLUMN last_notify_error TEXT"
             )
             upgraded_legacy_notify_model = True
         if "next_retry_at" not in columns:
-            await self._conn.execute(
+            await conn.execute(
                 "ALTER TABLE tokens ADD COLUMN next_retry_at TEXT"
             )
             upgraded_legacy_notify_model = True
         if "dead_letter" not in columns:
-            await self._conn.execute(
+            await conn.execute(
                 "ALTER TABLE tokens ADD COLUMN dead_letter INTEGER NOT NULL DEFAULT 0"
             )
             upgraded_legacy_notify_model = True
         if upgraded_legacy_notify_model:
             # Avoid replaying historical rows after migration to retry queue semantics.
-            await self._conn.execute(
+            await conn.execute(
                 """UPDATE tokens
                    SET notified = 1,
                        notification_attempts = 0,
@@ -130,117 +239,286 @@ class Database:
                 "Applied DB migration: marked existing unnotified rows as notified"
             )
 
+    async def _register_flusher(self) -> None:
+        """
+        Background task that drains queued registrations. Waits for the first
+        enqueue, lingers briefly so neighbours in the same poll batch pile up,
+        then flushes everything under one commit.
+        """
+        while True:
+            await self._registration_event.wait()
+            self._registration_event.clear()
+            await asyncio.sleep(self._REGISTER_FLUSH_DELAY)
+            try:
+                await self.flush_registrations()
+            except Exception:
+                logger.exception("Failed to flush queued token registrations")
+
+    async def flush_registrations(self) -> None:
+        """Write all queued register_token rows in one batched transaction."""
+        if not self._pending_registrations:
+            return
+        rows = self._pending_registrations
+        self._pending_registrations = []
+        self._pending_registration_keys = set()
+        conn = self._require_conn()
+        # One discovered_at stamp per flush, bound explicitly so the stored
+        # format matches every other writer's Python isoformat (the rows
+        # themselves stay 7-tuples for the requeue path below).
+        now_iso = datetime.now(timezone.utc).isoformat()
+        stamped = [row + (now_iso,) for row in rows]
+        try:
+            # transaction() serializes on the shared writer lock, so this
+            # waits out any transaction another task has open.
+            async with self.transaction():
+                await conn.executemany(self._SQL_INSERT_TOKEN, stamped)
+        except BaseException:
+            # A failed flush must not forget the tokens — dropping them would
+            # re-process every one (Telegram lookups included) next poll.
+            # Re-queue ahead of anything that arrived during the await,
+            # restore their keys so token_exists keeps answering True, and
+            # wake the flusher to retry.
+            self._pending_registrations = rows + self._pending_registrations
+            self._pending_registration_keys.update((row[0], row[1]) for row in rows)
+            self._registration_event.set()
+            raise
+
+    @asynccontextmanager
+    async def transaction(self):
+        """
+        Run a block of writes under one BEGIN IMMEDIATE … COMMIT, so a poll's
+        worth of inserts costs a single fsync. The lock makes each writer wait
+        for the previous transaction to finish — an instance-flag "join the
+        open transaction" shortcut here let the register flusher interleave
+        its writes into another task's transaction, where a savepoint or
+        whole-transaction rollback silently destroyed them.
+        """
+        conn = self._require_conn()
+        async with self._txn_lock:
+            await conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield
+            except BaseException:
+                await conn.rollback()
+                raise
+            else:
+                await conn.commit()
+
     async def close(self) -> None:
+        if self._flush_task:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+        if self._conn:
+            # Don't drop registrations still sitting in the queue.
+            await self.flush_registrations()
+        if self._read_conn:
+            self._read_conn.close()
+            self._read_conn = None
         if self._conn:
             await self._conn.close()
+            self._conn = None
             logger.info("Database connection closed")
 
     async def token_exists(self, chain: str, token_address: str) -> bool:
         """Check if a token has already been stored."""
-        assert self._conn
-        cursor = await self._conn.execute(
-            "SELECT 1 FROM tokens WHERE chain = ? AND token_address = ?",
+        # Registrations awaiting their batched flush count as stored.
+        if (chain, token_address.lower()) in self._pending_registration_keys:
+            return True
+        # Sub-millisecond indexed lookup — run it synchronously on the read
+        # connection rather than bouncing through aiosqlite's worker thread.
+        if self._read_conn is not None:
+            row = self._read_conn.execute(
+                self._SQL_TOKEN_EXISTS, (chain, token_address.lower())
+            ).fetchone()
+            return row is not None
+        conn = self._require_conn()
+        cursor = await conn.execute(
+            self._SQL_TOKEN_EXISTS,
             (chain, token_address.lower()),
         )
         row = await cursor.fetchone()
         return row is not None
 
-    async def insert_lead(self, lead: LeadRecord) -> int:
+    async def tokens_exist(
+        self, pairs: list[tuple[str, str]]
+    ) -> frozenset[tuple[str, str]]:
         """
-        Insert a full lead record across all tables.
-        Returns the token_id.
+        Bulk existence check for (chain, token_address) pairs.
+        Returns the subset of pairs already stored, as a frozenset for O(1)
+        membership tests in the caller. Issues one query per 499-pair chunk
+        (998 bound parameters) to stay under the 999-variable default limit
+        of SQLite builds older than 3.32.
         """
-        assert self._conn
+        # Make queued registrations visible to the bulk query.
+        await self.flush_registrations()
+        conn = self._require_conn()
+        found: set[tuple[str, str]] = set()
+        for start in range(0, len(pairs), 499):
+            chunk = pairs[start : start + 499]
+            placeholders = ",".join(["(?,?)"] * len(chunk))
+            params = [value for pair in chunk for value in pair]
+            cursor = await conn.execute(
+                "SELECT chain, token_address FROM tokens "
+                f"WHERE (chain, token_address) IN (VALUES {placeholders})",
+                params,
+            )
+            rows = await cursor.fetchall()
+            found.update((row[0], row[1]) for row in rows)
+        return frozenset(found)
 
-        # Insert token
-        cursor = await self._conn.execute(
-            """INSERT OR IGNORE INTO tokens
+    async def _write_lead(self, conn: aiosqlite.Connection, lead: LeadRecord) -> int:
+        """
+        Issue the statements for one lead; the caller owns the transaction.
+        (SQLite has no writable CTEs, so tokens/socials/wallets cannot be
+        collapsed into one compound statement — the shared transaction is
+        what amortizes the commit cost here.)
+        """
+        cursor = await conn.execute(
+            """INSERT INTO tokens
                (chain, token_address, token_name, token_symbol,
                 pair_address, dexscreener_url, pair_created_at, discovered_at, notified,
                 notification_attempts, last_notify_error, next_retry_at, dead_letter)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, 0, NULL, NULL, 0)""",
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, 0, NULL, NULL, 0)
+               ON CONFLICT(chain, token_address)
+               DO UPDATE SET discovered_at = tokens.discovered_at
+               RETURNING id""",
             (
                 lead.chain,
-                lead.token_address.lower(),
+                lead.token_address,
                 lead.token_name,
                 lead.token_symbol,
                 lead.pair_address,
                 lead.dexscreener_url,
                 lead.pair_created_at.isoformat(),
-                lead.discovered_at.isoformat(),
+                # Always bind an isoformat stamp — the column default writes
+                # a different format, which breaks lexicographic ordering.
+                (lead.discovered_at or datetime.now(timezone.utc)).isoformat(),
                 int(lead.notified),
             ),
         )
-
-        if cursor.rowcount == 0:
-            # Already existed
-            cur2 = await self._conn.execute(
-                "SELECT id FROM tokens WHERE chain = ? AND token_address = ?",
-                (lead.chain, lead.token_address.lower()),
-            )
-            row = await cur2.fetchone()
-            return row[0]
-
-        token_id = cursor.lastrowid
-        assert token_id is not None
+        row = await cursor.fetchone()
+        token_id = row[0]
 
         # Insert socials
-        await self._conn.execute(
+        await conn.execute(
             """INSERT OR IGNORE INTO socials (token_id, telegram, twitter, website)
                VALUES (?, ?, ?, ?)""",
             (token_id, lead.telegram_link, lead.twitter_link, lead.website),
         )
 
-        # Insert admins
-        for admin in lead.admins:
-            await self._conn.execute(
-                "INSERT INTO admins (token_id, username, is_creator) VALUES (?, ?, ?)",
-                (token_id, admin.username, int(admin.is_creator)),
+        # Insert admins — one prepared statement bound for the whole batch.
+        # bool binds as a native SQLite integer, so no per-row int() cast,
+        # and the generator avoids materializing an intermediate list.
+        if lead.admins:
+            await conn.executemany(
+                "INSERT OR IGNORE INTO admins (token_id, username, is_creator) VALUES (?, ?, ?)",
+                (
+                    (token_id, admin.username, admin.is_creator)
+                    for admin in lead.admins
+                ),
             )
 
         # Insert wallet
         if lead.deployer_wallet:
-            await self._conn.execute(
+            await conn.execute(
                 "INSERT OR IGNORE INTO wallets (token_id, deployer_wallet) VALUES (?, ?)",
                 (token_id, lead.deployer_wallet),
             )
 
-        await self._conn.commit()
+        return token_id
+
+    async def insert_lead(self, lead: LeadRecord) -> int:
+        """
+        Insert a full lead record across all tables.
+        Returns the token_id.
+        """
+        conn = self._require_conn()
+        async with self.transaction():
+            token_id = await self._write_lead(conn, lead)
         logger.info(
             "Stored lead: %s/%s (token_id=%d)", lead.chain, lead.token_symbol, token_id
         )
         return token_id
 
-    async def register_token(self, chain: str, token_address: str, token_name: str, 
-                             token_symbol: str, pair_address: str, 
+    async def insert_leads_many(self, leads: list[LeadRecord]) -> list[Optional[int]]:
+        """
+        Insert a poll's worth of leads under one transaction (one fsync).
+        Each lead runs inside a SAVEPOINT so one bad row rolls back alone.
+        Returns token ids aligned with the input; None marks a failed lead.
+        """
+        if not leads:
+            return []
+        conn = self._require_conn()
+        token_ids: list[Optional[int]] = []
+        async with self.transaction():
+            for index, lead in enumerate(leads):
+                savepoint = f"lead_{index}"
+                await conn.execute(f"SAVEPOINT {savepoint}")
+                try:
+                    token_ids.append(await self._write_lead(conn, lead))
+                except Exception:
+                    await conn.execute(f"ROLLBACK TO {savepoint}")
+                    logger.exception(
+                        "Failed to persist lead %s/%s in batch",
+                        lead.chain,
+                        lead.token_symbol,
+                    )
+                    token_ids.append(None)
+                finally:
+                    await conn.execute(f"RELEASE {savepoint}")
+        return token_ids
+
+    async def register_token(self, chain: str, token_address: str, token_name: str,
+                             token_symbol: str, pair_address: str,
                              dexscreener_url: str, pair_created_at: datetime) -> None:
         """
         Register a token as 'seen' even if it's not a valid lead.
         This prevents re-processing tokens that were skipped (e.g. no Telegram).
+
+        Rows are queued and committed together by the background flusher
+        (within ~50ms), amortizing one fsync across the whole poll batch;
+        token_exists answers from the queue in the meantime.
         """
-        assert self._conn
-        await self._conn.execute(
-            """INSERT OR IGNORE INTO tokens
-               (chain, token_address, token_name, token_symbol,
-                pair_address, dexscreener_url, pair_created_at, discovered_at, notified,
-                notification_attempts, last_notify_error, next_retry_at, dead_letter)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?, 0, 0, NULL, NULL, 0)""",
+        address = token_address.lower()
+        self._pending_registrations.append(
             (
                 chain,
-                token_address.lower(),
+                address,
                 token_name,
                 token_symbol,
                 pair_address,
                 dexscreener_url,
                 pair_created_at.isoformat(),
-                datetime.now(timezone.utc).isoformat(),
-            ),
+            )
         )
-        await self._conn.commit()
+        self._pending_registration_keys.add((chain, address))
+        self._registration_event.set()
+        if len(self._pending_registrations) >= self._REGISTER_FLUSH_MAX_ROWS:
+            await self.flush_registrations()
+
+    async def batch_register_tokens(
+        self, rows: list[tuple[str, str, str, str, str, str, str, str]]
+    ) -> None:
+        """
+        Register many 'seen' tokens in one prepared-statement batch.
+
+        Each row matches the parameter order of ``_SQL_INSERT_TOKEN``:
+        (chain, token_address, token_name, token_symbol, pair_address,
+        dexscreener_url, pair_created_at_iso, discovered_at_iso).
+        """
+        if not rows:
+            return
+        conn = self._require_conn()
+        async with self.transaction():
+            await conn.executemany(self._SQL_INSERT_TOKEN, rows)
 
     async def mark_notified(self, chain: str, token_address: str) -> None:
-        assert self._conn
-        await self._conn.execute(
+        conn = self._require_conn()
+        await conn.execute(
             """UPDATE tokens
                SET notified = 1,
                    notification_attempts = 0,
@@ -248,9 +526,9 @@ class Database:
                    next_retry_at = NULL,
                    dead_letter = 0
                WHERE chain = ? AND token_address = ?""",
-            (chain, token_address.lower()),
+            (chain, token_address),
         )
-        await self._conn.commit()
+        await conn.commit()
 
     async def record_notification_failure(
         self,
@@ -267,12 +545,12 @@ class Database:
         Returns:
           (scheduled_for_retry, attempts, next_retry_at)
         """
-        assert self._conn
-        row_cursor = await self._conn.execute(
+        conn = self._require_conn()
+        row_cursor = await conn.execute(
             """SELECT notification_attempts
                FROM tokens
                WHERE chain = ? AND token_address = ?""",
-            (chain, token_address.lower()),
+            (chain, token_address),
         )
         row = await row_cursor.fetchone()
         current_attempts = int(row["notification_attempts"]) if row else 0
@@ -280,7 +558,7 @@ class Database:
         safe_error = error[:500]
 
         if attempts >= max_attempts:
-            await self._conn.execute(
+            await conn.execute(
                 """UPDATE tokens
                    SET notified = 0,
                        notification_attempts = ?,
@@ -288,9 +566,9 @@ class Database:
                        next_retry_at = NULL,
                        dead_letter = 1
                    WHERE chain = ? AND token_address = ?""",
-                (attempts, safe_error, chain, token_address.lower()),
+                (attempts, safe_error, chain, token_address),
             )
-            await self._conn.commit()
+            await conn.commit()
             return False, attempts, None
 
         delay_seconds = min(
@@ -298,7 +576,7 @@ class Database:
             max_delay_seconds,
         )
         next_retry_at = datetime.now(timezone.utc) + timedelta(seconds=delay_seconds)
-        await self._conn.execute(
+        await conn.execute(
             """UPDATE tokens
                SET notified = 0,
                    notification_attempts = ?,
@@ -311,16 +589,16 @@ class Database:
                 safe_error,
                 next_retry_at.isoformat(),
                 chain,
-                token_address.lower(),
+                token_address,
             ),
         )
-        await self._conn.commit()
+        await conn.commit()
         return True, attempts, next_retry_at
 
     async def get_unnotified_leads(self, limit: int = 25) -> list[LeadRecord]:
-        assert self._conn
+        conn = self._require_conn()
         now_iso = datetime.now(timezone.utc).isoformat()
-        cursor = await self._conn.execute(
+        cursor = await conn.execute(
             """SELECT
                    t.id,
                    t.chain,
@@ -351,7 +629,7 @@ class Database:
         leads: list[LeadRecord] = []
         for row in rows:
             token_id = row["id"]
-            admin_cursor = await self._conn.execute(
+            admin_cursor = await conn.execute(
                 "SELECT username, is_creator FROM admins WHERE token_id = ? ORDER BY id ASC",
                 (token_id,),
             )
@@ -383,10 +661,43 @@ class Database:
 
         return leads
 
-    async def get_recent_leads(self, limit: int = 50) -> list[dict]:
-        """Retrieve recent leads for diagnostics."""
-        assert self._conn
-        cursor = await self._conn.execute(
+    async def get_recent_leads(self, limit: int = 50) -> list[RecentLead]:
+        """
+        Retrieve recent leads, projecting only the rendered columns.
+        Rows come back as lightweight named tuples rather than dicts.
+        """
+        conn = self._require_conn()
+        cursor = await conn.execute(
+            """SELECT t.chain, t.token_symbol, t.token_address, t.dexscreener_url,
+                      t.pair_created_at, t.discovered_at,
+                      s.telegram, s.twitter, s.website, w.deployer_wallet
+               FROM tokens t
+               LEFT JOIN socials s ON s.token_id = t.id
+               LEFT JOIN wallets w ON w.token_id = t.id
+               ORDER BY t.discovered_at DESC
+               LIMIT ?""",
+            (limit,),
+        )
+        # Size the fetch buffer to the known row count up front.
+        cursor.arraysize = limit
+        rows = await cursor.fetchall()
+        return [RecentLead(*row) for row in rows]
+
+    async def recent_token_keys(self, limit: int = 10000) -> list[tuple[str, str]]:
+        """Most recently discovered (chain, token_address) keys, newest first."""
+        conn = self._require_conn()
+        cursor = await conn.execute(
+            "SELECT chain, token_address FROM tokens ORDER BY id DESC LIMIT ?",
+            (limit,),
+        )
+        cursor.arraysize = limit
+        rows = await cursor.fetchall()
+        return [(row[0], row[1]) for row in rows]
+
+    async def get_recent_leads_dicts(self, limit: int = 50) -> list[dict]:
+        """Full-row variant for diagnostics that want every token column."""
+        conn = self._require_conn()
+        cursor = await conn.execute(
             """SELECT t.*, s.telegram, s.twitter, s.website, w.deployer_wallet
                FROM tokens t
                LEFT JOIN socials s ON s.token_id = t.id
@@ -11,28 +11,97 @@ Monitoring Strategy:
 from __future__ import annotations
 
 import asyncio
-from collections import Counter, deque
+from collections import deque
+from dataclasses import dataclass
 import logging
+import time
 from datetime import datetime, timezone
 import re
+from collections.abc import AsyncIterator
 from typing import Any, Optional
 
 import httpx
-from tenacity import RetryCallState, retry, stop_after_attempt, wait_exponential
+from tenacity import (
+    RetryCallState,
+    retry,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential,
+)
 
 from .config import Config
 from .models import SocialLinks, TokenPair
 from .utils import rate_limiters
 
+try:
+    import orjson
+
+    def _loads(resp: httpx.Response) -> Any:
+        return orjson.loads(resp.content)
+except ImportError:  # pragma: no cover - orjson is in requirements
+    def _loads(resp: httpx.Response) -> Any:
+        return resp.json()
+
 logger = logging.getLogger("dexbot.dexscreener")
 EVM_ADDRESS_PATTERN = re.compile(r"0x[a-fA-F0-9]{40}")
 SOLANA_ADDRESS_PATTERN = re.compile(r"[1-9A-HJ-NP-Za-km-z]{32,44}")
+# EVM validation runs as one C-level translate: hex digits collapse to "0",
+# anything else survives and breaks the all-zeros comparison below.
+_EVM_HEX_TO_ZERO = bytes.maketrans(b"0123456789abcdefABCDEF", b"0" * 22)
+_EVM_BODY_ZEROS = b"0" * 40
+# Fallback extraction of social links from free-form profile descriptions.
+_TG_DESC_RE = re.compile(r"https?://t\.me/\S+")
+_TW_DESC_RE = re.compile(r"https?://(?:twitter\.com|x\.com)/\S+")
+# Trailing punctuation that tends to cling to URLs found in prose.
+_URL_TRAIL = ".,!)"
+# Link classification: one exact lookup on the declared type, then one on
+# the URL host, instead of a chain of substring scans per link.
+_PLATFORM_BY_TYPE = {
+    "telegram": "telegram",
+    "twitter": "twitter",
+    "x": "twitter",
+    "website": "website",
+}
+_PLATFORM_BY_HOST = {
+    "t.me": "telegram",
+    "telegram.me": "telegram",
+    "x.com": "twitter",
+    "twitter.com": "twitter",
+}
+_HOST_RE = re.compile(r"https?://(?:www\.)?([^/?#]+)")
+
+
+def _is_retryable(exc: BaseException) -> bool:
+    """
+    Backoff only helps for transient failures: network/timeout errors,
+    server errors, and rate limiting. A 400/404 (e.g. no pairs for a token
+    on that chain) will fail identically on every attempt, so retrying it
+    just burns 2s+4s of backoff while holding a fan-out semaphore slot.
+    """
+    if isinstance(exc, (httpx.TransportError, httpx.TimeoutException)):
+        return True
+    return isinstance(exc, httpx.HTTPStatusError) and (
+        exc.response.status_code >= 500 or exc.response.status_code == 429
+    )
+
+
+@dataclass(slots=True)
+class DexMetricsSnapshot:
+    """Point-in-time view of the client's call counters."""
+
+    profile_calls: int = 0
+    pair_calls: int = 0
+    pair_cache_hits: int = 0
+    retry_events: int = 0
+    profile_failures: int = 0
+    pair_failures: int = 0
+    parse_failures: int = 0
 
 
 def _record_retry_event(retry_state: RetryCallState) -> None:
     client = retry_state.args[0] if retry_state.args else None
     if isinstance(client, DexscreenerClient):
-        client._metrics["retry_events"] += 1
+        client._retry_events += 1
     sleep_for = retry_state.next_action.sleep if retry_state.next_action else 0.0
     logger.warning(
         "Dexscreener call failed on attempt %d; retrying in %.1fs",
@@ -44,35 +113,68 @@ def _record_retry_event(retry_state: RetryCallState) -> None:
 class DexscreenerClient:
     """Async client for Dexscreener public API."""
 
+    # The profile feed overlaps heavily between 30s polls while pair data
+    # changes slowly, so a short TTL on pair responses skips the repeat
+    # HTTP calls without serving meaningfully stale liquidity/socials.
+    _PAIR_TTL = 60.0
+    _PAIR_CACHE_MAX = 1024
+
     def __init__(self, config: Config):
         self._config = config
         self._base = config.dexscreener_base_url
+        # Everything goes to one origin, so multiplex the per-poll pair
+        # fan-out over HTTP/2 and keep idle connections alive across the
+        # ~30s poll interval instead of re-doing TCP+TLS each cycle.
         self._client = httpx.AsyncClient(
             base_url=self._base,
-            timeout=httpx.Timeout(15.0),
+            http2=True,
+            timeout=httpx.Timeout(15.0, connect=5.0),
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=50,
+                keepalive_expiry=30.0,
+            ),
             headers={"Accept": "application/json"},
         )
         # Rate limiters
         self._profile_limiter = rate_limiters.get("dex_profiles", max_calls=55, period=60)
         self._pair_limiter = rate_limiters.get("dex_pairs", max_calls=250, period=60)
-        self._metrics: Counter[str] = Counter()
+        # One semaphore for the pair fan-out, shared across polls so two
+        # overlapping cycles can't exceed the intended bound together; capped
+        # at the connection-pool size so queuing happens here, not in httpx.
+        self._fanout_sem = asyncio.Semaphore(
+            min(max(config.dexscreener_pair_fetch_concurrency, 1), 100)
+        )
+        # Fixed counters — attribute stores are cheaper than Counter's
+        # hash+dict path and typos can't silently mint new keys.
+        self._profile_calls = 0
+        self._pair_calls = 0
+        self._pair_cache_hits = 0
+        self._retry_events = 0
+        self._profile_failures = 0
+        self._pair_failures = 0
+        self._parse_failures = 0
+        self._freshness_skipped = 0
+        self._pair_cache: dict[tuple[str, str], tuple[float, list[dict[str, Any]]]] = {}
 
     async def close(self) -> None:
         await self._client.aclose()
 
-    def metrics_snapshot(self) -> dict[str, int]:
-        return {
-            "profile_calls": self._metrics["profile_calls"],
-            "pair_calls": self._metrics["pair_calls"],
-            "retry_events": self._metrics["retry_events"],
-            "profile_failures": self._metrics["profile_failures"],
-            "pair_failures": self._metrics["pair_failures"],
-            "parse_failures": self._metrics["parse_failures"],
-        }
+    def metrics_snapshot(self) -> DexMetricsSnapshot:
+        return DexMetricsSnapshot(
+            profile_calls=self._profile_calls,
+            pair_calls=self._pair_calls,
+            pair_cache_hits=self._pair_cache_hits,
+            retry_events=self._retry_events,
+            profile_failures=self._profile_failures,
+            pair_failures=self._pair_failures,
+            parse_failures=self._parse_failures,
+        )
 
     # ── Latest Token Profiles ───────────────────────────────────
 
     @retry(
+        retry=retry_if_exception(_is_retryable),
         stop=stop_after_attempt(3),
         wait=wait_exponential(min=2, max=10),
         before_sleep=_record_retry_event,
@@ -84,11 +186,13 @@ class DexscreenerClient:
         Returns list of recently updated token profiles.
         Each has: chainId, tokenAddress, description, links[].
         """
-        async with self._profile_limiter:
-            self._metrics["profile_calls"] += 1
-            resp = await self._client.get("/token-profiles/latest/v1")
-            resp.raise_for_status()
-            data = resp.json()
+        # Take a rate-limit slot up front; the HTTP await itself must not sit
+        # inside the limiter or gated callers serialize behind this response.
+        await self._profile_limiter.acquire()
+        self._profile_calls += 1
+        resp = await self._client.get("/token-profiles/latest/v1")
+        resp.raise_for_status()
+        data = _loads(resp)
 
         if isinstance(data, list):
             return data
@@ -97,6 +201,7 @@ class DexscreenerClient:
     # ── Pair Details by Token Address ───────────────────────────
 
     @retry(
+        retry=retry_if_exception(_is_retryable),
         stop=stop_after_attempt(3),
         wait=wait_exponential(min=2, max=10),
         before_sleep=_record_retry_event,
@@ -108,24 +213,43 @@ class DexscreenerClient:
         """
         GET /token-pairs/v1/{chainId}/{tokenAddress}
         Returns list of pairs for a token on a specific chain.
+        Responses are cached for _PAIR_TTL seconds per (chain, address).
         """
-        async with self._pair_limiter:
-            self._metrics["pair_calls"] += 1
-            resp = await self._client.get(
-                f"/token-pairs/v1/{chain_id}/{token_address}"
-            )
-            resp.raise_for_status()
-            data = resp.json()
+        cache_key = (chain_id, token_address)
+        cached = self._pair_cache.get(cache_key)
+        if cached is not None and time.monotonic() - cached[0] < self._PAIR_TTL:
+            self._pair_cache_hits += 1
+            return cached[1]
+
+        await self._pair_limiter.acquire()
+        self._pair_calls += 1
+        resp = await self._client.get(
+            f"/token-pairs/v1/{chain_id}/{token_address}"
+        )
+        resp.raise_for_status()
+        data = _loads(resp)
 
         if isinstance(data, list):
-            return data
-        if isinstance(data, dict) and "pairs" in data:
-            return data["pairs"] or []
-        return []
+            pairs = data
+        elif isinstance(data, dict) and "pairs" in data:
+            pairs = data["pairs"] or []
+        else:
+            pairs = []
+
+        if len(self._pair_cache) >= self._PAIR_CACHE_MAX:
+            now = time.monotonic()
+            self._pair_cache = {
+                key: entry
+                for key, entry in self._pair_cache.items()
+                if now - entry[0] < self._PAIR_TTL
+            }
+        self._pair_cache[cache_key] = (time.monotonic(), pairs)
+        return pairs
 
     # ── Pair Details by Pair Address ────────────────────────────
 
     @retry(
+        retry=retry_if_exception(_is_retryable),
         stop=stop_after_attempt(3),
         wait=wait_exponential(min=2, max=10),
         before_sleep=_record_retry_event,
@@ -136,44 +260,46 @@ class DexscreenerClient:
         GET /latest/dex/pairs/{chainId}/{pairAddress}
         Returns pair details.
         """
-        async with self._pair_limiter:
-            self._metrics["pair_calls"] += 1
-            resp = await self._client.get(
-                f"/latest/dex/pairs/{chain_id}/{pair_address}"
-            )
-            resp.raise_for_status()
-            data = resp.json()
+        await self._pair_limiter.acquire()
+        self._pair_calls += 1
+        resp = await self._client.get(
+            f"/latest/dex/pairs/{chain_id}/{pair_address}"
+        )
+        resp.raise_for_status()
+        data = _loads(resp)
 
         pairs = data.get("pairs") or []
         return pairs[0] if pairs else None
 
     # ── High-Level: Discover New Tokens ─────────────────────────
 
-    async def discover_new_tokens(self) -> list[tuple[TokenPair, SocialLinks]]:
+    async def iter_discoveries(self) -> AsyncIterator[tuple[TokenPair, SocialLinks]]:
         """
-        Poll latest profiles, filter by tracked chains, enrich with pair data,
-        and return (TokenPair, SocialLinks) tuples for tokens within age window.
+        Stream (TokenPair, SocialLinks) tuples for tokens within the age
+        window, yielding each as its pair fan-out completes. Callers can
+        start enriching the first discovery while the remaining pair
+        fetches are still in flight.
         """
-        results: list[tuple[TokenPair, SocialLinks]] = []
-
         try:
             profiles = await self.get_latest_token_profiles()
         except Exception as e:
-            self._metrics["profile_failures"] += 1
+            self._profile_failures += 1
             logger.error("Failed to fetch token profiles: %s", e)
-            return results
+            return
 
         logger.debug("Fetched %d token profiles", len(profiles))
 
+        # Single pass with O(1) frozenset membership (tracked_chains_set is
+        # precomputed on Config). The lowercased chain is stashed on the
+        # profile so the round-robin sampler and _process_profile reuse it
+        # instead of re-lowercasing the same string downstream.
+        tracked = self._config.tracked_chains_set
         filtered_profiles: list[dict[str, Any]] = []
         for profile in profiles:
             chain_id = profile.get("chainId", "").lower()
-            token_address = profile.get("tokenAddress", "")
-            if chain_id not in self._config.tracked_chains:
-                continue
-            if not token_address:
-                continue
-            filtered_profiles.append(profile)
+            if chain_id in tracked and profile.get("tokenAddress"):
+                profile["_chain"] = chain_id
+                filtered_profiles.append(profile)
 
         max_profiles = max(self._config.dexscreener_max_profiles_per_poll, 1)
         if self._config.dexscreener_fair_chain_sampling:
@@ -183,23 +309,23 @@ class DexscreenerClient:
         else:
             filtered_profiles = filtered_profiles[:max_profiles]
 
-        concurrency = max(self._config.dexscreener_pair_fetch_concurrency, 1)
-        semaphore = asyncio.Semaphore(concurrency)
         tasks = [
-            self._process_profile(profile, semaphore)
+            asyncio.create_task(self._process_profile(profile, self._fanout_sem))
             for profile in filtered_profiles
         ]
-        outcomes = await asyncio.gather(*tasks, return_exceptions=True)
-
-        for outcome in outcomes:
-            if isinstance(outcome, Exception):
-                self._metrics["pair_failures"] += 1
-                logger.warning("Profile processing failed: %s", outcome)
+        for future in asyncio.as_completed(tasks):
+            try:
+                outcome = await future
+            except Exception as e:
+                self._pair_failures += 1
+                logger.warning("Profile processing failed: %s", e)
                 continue
             if outcome is not None:
-                results.append(outcome)
+                yield outcome
 
-        return results
+    async def discover_new_tokens(self) -> list[tuple[TokenPair, SocialLinks]]:
+        """Materialized variant of iter_discoveries."""
+        return [discovery async for discovery in self.iter_discoveries()]
 
     def _select_profiles_round_robin(
         self, profiles: list[dict[str, Any]], max_profiles: int
@@ -208,36 +334,36 @@ class DexscreenerClient:
             chain: deque() for chain in self._config.tracked_chains
         }
         for profile in profiles:
-            chain = profile.get("chainId", "").lower()
+            chain = profile["_chain"]
             if chain in buckets:
                 buckets[chain].append(profile)
 
-        chain_order = [chain for chain in self._config.tracked_chains if buckets[chain]]
+        # Rotate a deque of the non-empty buckets: take one profile from the
+        # front bucket and re-append it only while it still has entries.
+        # O(n) total with no per-round list rebuilds.
+        active = deque(
+            buckets[chain] for chain in self._config.tracked_chains if buckets[chain]
+        )
         selected: list[dict[str, Any]] = []
-
-        while chain_order and len(selected) < max_profiles:
-            next_round: list[str] = []
-            for chain in chain_order:
-                bucket = buckets[chain]
-                if bucket and len(selected) < max_profiles:
-                    selected.append(bucket.popleft())
-                if bucket:
-                    next_round.append(chain)
-            chain_order = next_round
+        while active and len(selected) < max_profiles:
+            bucket = active.popleft()
+            selected.append(bucket.popleft())
+            if bucket:
+                active.append(bucket)
 
         return selected
 
     async def _process_profile(
         self, profile: dict[str, Any], semaphore: asyncio.Semaphore
     ) -> Optional[tuple[TokenPair, SocialLinks]]:
-        chain_id = profile.get("chainId", "").lower()
+        chain_id = profile["_chain"]
         token_address = profile.get("tokenAddress", "")
 
         async with semaphore:
             try:
                 pairs = await self.get_pairs_by_token(chain_id, token_address)
             except Exception as e:
-                self._metrics["pair_failures"] += 1
+                self._pair_failures += 1
                 logger.warning(
                     "Failed to get pairs for %s/%s: %s", chain_id, token_address, e
                 )
@@ -246,29 +372,43 @@ class DexscreenerClient:
             if not pairs:
                 return None
 
+            # Cheap pre-check on the raw millisecond timestamps: if even the
+            # newest pair is outside the age window, skip model construction
+            # and address validation entirely — the majority path for the
+            # profiles feed, which mostly returns tokens older than the window.
+            newest_ms = max((pair.get("pairCreatedAt") or 0) for pair in pairs)
+            if not newest_ms:
+                return None
+            age_minutes = (time.time() - newest_ms / 1000.0) / 60.0
+            if age_minutes > self._config.max_token_age_minutes:
+                self._freshness_skipped += 1
+                return None
+
             # Explicitly pick the freshest valid pair by pairCreatedAt.
             selected = self._select_primary_pair(pairs, chain_id)
             if selected is None:
-                self._metrics["parse_failures"] += 1
+                self._parse_failures += 1
                 return None
             token_pair, pair_data = selected
 
-            # Check freshness
-            age_minutes = (
-                datetime.now(timezone.utc) - token_pair.pair_created_at
-            ).total_seconds() / 60
+            # Check freshness of the selected pair — raw float math, no
+            # datetime construction on this path.
+            created_ms = pair_data.get("pairCreatedAt") or 0
+            age_minutes = (time.time() - created_ms / 1000.0) / 60.0
             if age_minutes > self._config.max_token_age_minutes:
-                self._metrics["freshness_skipped"] += 1
+                self._freshness_skipped += 1
                 return None
 
             # Extract social links from both profile and pair data
             social = self._extract_socials(profile, pair_data)
 
+            # %.10s truncates inside the logging formatter, so the slice and
+            # concat only happen if a handler actually emits the record.
             logger.debug(
-                "Discovered new token: %s/%s (%s) — age %.1f min",
+                "Discovered new token: %s/%s (%.10s…) — age %.1f min",
                 chain_id,
                 token_pair.token_symbol,
-                token_pair.token_address[:10] + "…",
+                token_pair.token_address,
                 age_minutes,
             )
             return token_pair, social
@@ -279,30 +419,33 @@ class DexscreenerClient:
     def _select_primary_pair(
         cls, pairs: list[dict[str, Any]], chain_id: str
     ) -> Optional[tuple[TokenPair, dict[str, Any]]]:
-        valid_pairs: list[tuple[TokenPair, dict[str, Any]]] = []
-        for pair_data in pairs:
+        # Walk candidates newest-first on the raw timestamp and take the
+        # first that parses — same result as max(valid, key=created_at) but
+        # only the winning pair pays for model construction.
+        for pair_data in sorted(
+            pairs, key=lambda p: p.get("pairCreatedAt") or 0, reverse=True
+        ):
             parsed = cls._parse_pair(pair_data, chain_id)
             if parsed is not None:
-                valid_pairs.append((parsed, pair_data))
-
-        if not valid_pairs:
-            return None
-
-        return max(valid_pairs, key=lambda item: item[0].pair_created_at)
+                return parsed, pair_data
+        return None
 
     @staticmethod
     def _parse_pair(pair_data: dict, chain_id: str) -> Optional[TokenPair]:
         """Parse raw pair JSON into TokenPair model."""
         try:
-            base = pair_data.get("baseToken", {})
-            created_ms = pair_data.get("pairCreatedAt")
+            # Bind the bound methods once — this function does a dozen dict
+            # reads per pair and runs for every candidate on the hot path.
+            get = pair_data.get
+            base_get = (get("baseToken") or {}).get
+            created_ms = get("pairCreatedAt")
             if not created_ms:
                 return None
 
-            token_address = (base.get("address") or "").strip()
-            pair_address = (pair_data.get("pairAddress") or "").strip()
-            dexscreener_url = (pair_data.get("url") or "").strip()
-            token_symbol = (base.get("symbol") or "").strip()
+            token_address = (base_get("address") or "").strip()
+            pair_address = (get("pairAddress") or "").strip()
+            dexscreener_url = (get("url") or "").strip()
+            token_symbol = (base_get("symbol") or "").strip()
 
             if not token_address or not pair_address or not dexscreener_url:
                 return None
@@ -314,19 +457,21 @@ class DexscreenerClient:
                 return None
 
             created_at = datetime.fromtimestamp(created_ms / 1000, tz=timezone.utc)
-            liquidity = pair_data.get("liquidity", {})
+            liquidity = get("liquidity") or {}
 
+            # Every field was checked or coalesced above — TokenPair is a
+            # plain slotted dataclass, so construction is attribute stores.
             return TokenPair(
                 chain=chain_id,
-                token_name=base.get("name", "Unknown"),
+                token_name=base_get("name") or "Unknown",
                 token_symbol=token_symbol,
                 token_address=token_address,
                 pair_address=pair_address,
-                dex_id=pair_data.get("dexId", ""),
+                dex_id=get("dexId", ""),
                 dexscreener_url=dexscreener_url,
                 pair_created_at=created_at,
-                liquidity_usd=liquidity.get("usd", 0) or 0,
-                fdv=pair_data.get("fdv", 0) or 0,
+                liquidity_usd=liquidity.get("usd") or 0,
+                fdv=get("fdv") or 0,
             )
         except Exception as e:
             logger.warning("Failed to parse pair data: %s", e)
@@ -335,85 +480,110 @@ class DexscreenerClient:
     @staticmethod
     def _is_valid_address(chain_id: str, address: str) -> bool:
         if chain_id in {"ethereum", "bsc", "base"}:
-            return bool(EVM_ADDRESS_PATTERN.fullmatch(address))
+            # Equivalent to EVM_ADDRESS_PATTERN.fullmatch but without the
+            # regex engine: length + prefix checks, then one bytes.translate.
+            if len(address) != 42 or not address.startswith("0x"):
+                return False
+            try:
+                body = address[2:].encode("ascii")
+            except UnicodeEncodeError:
+                return False
+            return body.translate(_EVM_HEX_TO_ZERO) == _EVM_BODY_ZEROS
         if chain_id == "solana":
             return bool(SOLANA_ADDRESS_PATTERN.fullmatch(address))
         return bool(address)
 
+    @staticmethod
+    def _classify_link(link_type: str, url: str) -> Optional[str]:
+        """Map a link to telegram/twitter/website with at most two lookups."""
+        platform = _PLATFORM_BY_TYPE.get(link_type)
+        if platform:
+            return platform
+        host_match = _HOST_RE.match(url)
+        if host_match:
+            platform = _PLATFORM_BY_HOST.get(host_match.group(1).lower())
+            if platform:
+                return platform
+        # Rare free-form labels like "Official Website".
+        if "website" in link_type:
+            return "website"
+        return None
+
     @staticmethod
     def _extract_socials(profile: dict, pair_data: dict) -> SocialLinks:
         """
         Extract Telegram, Twitter, and Website links from both
         the token profile and pair data.
         """
-        telegram = None
-        twitter = None
-        website = None
+        found: dict[str, Optional[str]] = {
+            "telegram": None,
+            "twitter": None,
+            "website": None,
+        }
 
-        # ── From profile links ──
+        # ── From profile links: classify each link exactly once ──
         for link in profile.get("links", []):
-            link_type = (link.get("type") or link.get("label", "")).lower()
             url = link.get("url", "")
             if not url:
                 continue
-
-            if "telegram" in link_type or "t.me" in url:
-                telegram = telegram or url
-            elif "twitter" in link_type or "x.com" in url or "twitter.com" in url:
-                twitter = twitter or url
-            elif "website" in link_type:
-                website = website or url
+            link_type = (link.get("type") or link.get("label", "")).lower()
+            platform = DexscreenerClient._classify_link(link_type, url)
+            if platform and not found[platform]:
+                found[platform] = url
+
+        # Profile links are often complete — stop before walking pair info.
+        if found["telegram"] and found["twitter"] and found["website"]:
+            return SocialLinks(
+                telegram_link=found["telegram"],
+                twitter_link=found["twitter"],
+                website=found["website"],
+            )
 
         # ── From pair info.socials ──
         info = pair_data.get("info", {})
         for social in info.get("socials", []):
             # Check for platform/handle (older format?) or type/url (newer format)
             platform = (social.get("platform") or social.get("type") or "").lower()
-            handle = social.get("handle", "")
-            url = social.get("url", "")
-
-            if not platform:
+            platform = _PLATFORM_BY_TYPE.get(platform)
+            if platform not in ("telegram", "twitter") or found[platform]:
                 continue
-
-            if platform == "telegram":
-                if not telegram:
-                    if url:
-                        telegram = url
-                    elif handle:
-                        telegram = f"https://t.me/{handle}" if not handle.startswith("http") else handle
-            elif platform in ("twitter", "x"):
-                if not twitter:
-                    if url:
-                        twitter = url
-                    elif handle:
-                        twitter = f"https://x.com/{handle}" if not handle.startswith("http") else handle
+            url = social.get("url", "")
+            handle = social.get("handle", "")
+            if url:
+                found[platform] = url
+            elif handle:
+                if handle.startswith("http"):
+                    found[platform] = handle
+                elif platform == "telegram":
+                    found[platform] = f"https://t.me/{handle}"
+                else:
+                    found[platform] = f"https://x.com/{handle}"
 
         # ── From pair info.websites ──
-        for w in info.get("websites", []):
-            url = w.get("url", "") # Dexscreener sometimes uses label/url here too
-            if not url: 
-                 # Fallback if structure is different
-                 url = w.get("value", "")
-            
-            if url and not website:
-                website = url
+        if not found["website"]:
+            for w in info.get("websites", []):
+                # Dexscreener sometimes uses label/url here too
+                url = w.get("url", "") or w.get("value", "")
+                if url:
+                    found["website"] = url
+                    break
 
         # ── From profile description (regex fallback) ──
-        import re
-
-        desc = profile.get("description", "") or ""
-        if not telegram:
-            tg_match = re.search(r"https?://t\.me/\S+", desc)
-            if tg_match:
-                telegram = tg_match.group(0).rstrip(".,!)")
-
-        if not twitter:
-            tw_match = re.search(r"https?://(?:twitter\.com|x\.com)/\S+", desc)
-            if tw_match:
-                twitter = tw_match.group(0).rstrip(".,!)")
+        # Only touch the description when a link is still missing.
+        if not found["telegram"] or not found["twitter"]:
+            desc = profile.get("description", "") or ""
+            if not found["telegram"]:
+                tg_match = _TG_DESC_RE.search(desc)
+                if tg_match:
+                    found["telegram"] = tg_match.group(0).rstrip(_URL_TRAIL)
+
+            if not found["twitter"]:
+                tw_match = _TW_DESC_RE.search(desc)
+                if tw_match:
+                    found["twitter"] = tw_match.group(0).rstrip(_URL_TRAIL)
 
         return SocialLinks(
-            telegram_link=telegram,
-            twitter_link=twitter,
-            website=website,
+            telegram_link=found["telegram"],
+            twitter_link=found["twitter"],
+            website=found["website"],
         )
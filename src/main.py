@@ -16,14 +16,15 @@ Usage:
 from __future__ import annotations
 
 import asyncio
-from collections import Counter
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, fields
 import logging
 import signal
 
 from .config import Config
 from .database import Database
 from .dexscreener import DexscreenerClient
-from .models import AdminResult, LeadRecord, TokenPair
+from .models import AdminResult, LeadRecord, SocialLinks, TokenPair
 from .notifier import Notifier
 from .social_extractor import SocialExtractor
 from .telegram_admin import TelegramAdminExtractor
@@ -32,6 +33,37 @@ from .wallet_lookup import WalletLookup
 
 logger = logging.getLogger("dexbot.main")
 
+# Shared result for every token whose admins can't be inspected. The
+# pipeline only reads these fields, so one instance serves all leads
+# instead of allocating a fresh AdminResult per discovery.
+_HIDDEN_ADMIN_RESULT = AdminResult(admins_hidden=True)
+
+
+@dataclass(slots=True)
+class PollMetrics:
+    """
+    Per-poll event counters. The key set is finite and known, so a slotted
+    struct of ints replaces Counter's per-increment dict lookups.
+    """
+
+    discoveries: int = 0
+    skipped_already_seen: int = 0
+    skipped_no_telegram: int = 0
+    skipped_no_visible_admins: int = 0
+    skipped_admins_hidden: int = 0
+    skipped_social_error: int = 0
+    processed: int = 0
+    notified: int = 0
+    notify_failed: int = 0
+    wallet_lookup_ok: int = 0
+    wallet_lookup_miss: int = 0
+    wallet_lookup_error: int = 0
+    registered_skipped: int = 0
+    retried_notified: int = 0
+    retried_notify_failed: int = 0
+    notify_retry_scheduled: int = 0
+    notify_dead_lettered: int = 0
+
 
 class LeadBot:
     """Main bot orchestrator."""
@@ -49,9 +81,30 @@ class LeadBot:
         self._telegram_admin_runtime_enabled = self._config.telegram_admin_enabled
         self._telegram_admin_degraded = False
         self._wallet = WalletLookup(self._config)
-        self._db = Database(self._config.database_path)
+        # Shared per-path instance, so anything else in the process opening
+        # the same database reuses this connection and its warm caches.
+        self._db = Database.instance(self._config.database_path)
         self._notifier = Notifier(self._config)
 
+        # Recently-confirmed (chain, token_address) keys. The same tokens
+        # reappear in the Dexscreener feed every poll until they age out of
+        # the window, so an in-process LRU answers the repeat existence
+        # checks without touching SQLite at all.
+        self._seen_cache: OrderedDict[tuple[str, str], None] = OrderedDict()
+
+        # Telethon sessions tolerate very little concurrency before FloodWait,
+        # so admin extraction stays serialized even when the pipeline fans out.
+        self._tg_admin_sem = asyncio.Semaphore(1)
+
+        # Retried leads currently queued on the background sender, so a lead
+        # isn't enqueued again before its outcome comes back (and so the
+        # outcome is counted under the retried_* metrics).
+        self._notify_retry_inflight: set[tuple[str, str]] = set()
+
+        # Dedup state for unhandled poll errors (see _log_poll_error).
+        self._last_error_sig: tuple[type, str] | None = None
+        self._error_repeat_count = 0
+
         # Stats
         self._metrics: Counter[str] = Counter()
         self._service_attempts: Counter[str] = Counter()
@@ -61,6 +114,21 @@ class LeadBot:
     def _enforce_filters(self) -> bool:
         return not self._config.allow_test_leads
 
+    def _mark_seen(self, chain: str, token_address: str) -> None:
+        cache = self._seen_cache
+        key = (chain, token_address.lower())
+        cache[key] = None
+        cache.move_to_end(key)
+        while len(cache) > self._config.seen_cache_size:
+            cache.popitem(last=False)
+
+    def _is_seen(self, chain: str, token_address: str) -> bool:
+        key = (chain, token_address.lower())
+        if key in self._seen_cache:
+            self._seen_cache.move_to_end(key)
+            return True
+        return False
+
     async def start(self) -> None:
         """Initialize all components and start the polling loop."""
         global logger
@@ -101,6 +169,23 @@ class LeadBot:
         # Initialize database
         await self._db.connect()
 
+        # Warm the seen-cache with the newest known tokens so the first
+        # polls after a restart skip repeat discoveries without DB hits.
+        # recent_token_keys returns newest first; insert oldest first so
+        # the newest tokens end up at the MRU end and are evicted last.
+        try:
+            recent_keys = await self._db.recent_token_keys(
+                limit=self._config.seen_cache_size
+            )
+            for chain, token_address in reversed(recent_keys):
+                self._mark_seen(chain, token_address)
+            logger.info("Seen-cache warmed with %d tokens", len(self._seen_cache))
+        except Exception as e:
+            logger.warning("Failed to warm seen-cache: %s", e)
+
+        # Background sender — keeps Telegram latency off the poll loop.
+        self._notifier.start(self._on_notify_result)
+
         # Connect Telethon only when explicitly enabled and configured.
         if self._telegram_admin_runtime_enabled:
             try:
@@ -159,6 +244,9 @@ class LeadBot:
         await self._social.close()
         await self._tg_admin.disconnect()
         await self._wallet.close()
+        # Drain queued notifications before the DB goes away — the sender's
+        # result callback writes notified/retry state.
+        await self._notifier.stop()
         await self._db.close()
 
         logger.info(
@@ -177,248 +265,409 @@ class LeadBot:
         while self._running:
             try:
                 await self._poll_once()
+                self._flush_repeated_errors()
             except Exception as e:
-                logger.error("Unhandled error in poll cycle: %s", e, exc_info=True)
+                self._log_poll_error(e)
 
             if self._running:
                 await asyncio.sleep(self._config.poll_interval_seconds)
 
+    def _log_poll_error(self, error: Exception) -> None:
+        """
+        Log an unhandled poll error, collapsing consecutive identical ones.
+        During an outage every cycle raises the same exception; formatting a
+        full traceback per poll dominates log volume, so tracebacks are only
+        attached at DEBUG and repeats are reported as a single count.
+        """
+        sig = (type(error), str(error))
+        if sig == self._last_error_sig:
+            self._error_repeat_count += 1
+            return
+        self._flush_repeated_errors()
+        self._last_error_sig = sig
+        logger.error(
+            "Unhandled error in poll cycle: %s",
+            error,
+            exc_info=logger.isEnabledFor(logging.DEBUG),
+        )
+
+    def _flush_repeated_errors(self) -> None:
+        if self._error_repeat_count:
+            logger.error(
+                "Previous poll error repeated %d more times", self._error_repeat_count
+            )
+        self._last_error_sig = None
+        self._error_repeat_count = 0
+
     async def _poll_once(self) -> None:
         """Single poll cycle: discover → enrich → filter → store → notify."""
         self._metrics["polls"] += 1
-        poll_metrics: Counter[str] = Counter()
+        poll_metrics = PollMetrics()
         logger.info("━━━ Poll #%d ━━━", self._metrics["polls"])
-        await self._retry_pending_notifications(poll_metrics)
-
-        # Step 1: Discover new tokens from Dexscreener
-        self._service_attempts["dex"] += 1
-        discoveries = await self._dex.discover_new_tokens()
-        poll_metrics["discoveries"] += len(discoveries)
-        logger.debug("Discovered %d potential leads within age window", len(discoveries))
-
-        for token_pair, socials in discoveries:
-            # Step 2: Check if already processed
-            if await self._db.token_exists(token_pair.chain, token_pair.token_address):
-                # Silent skip for already processed tokens to keep logs clean
-                poll_metrics["skipped_already_seen"] += 1
-                self._metrics["skipped_total"] += 1
-                continue
+        await self._retry_pending_notifications()
+
+        # Step 1: Stream discoveries from Dexscreener through a queue so
+        # enrichment starts on the first token while the pair fan-out for
+        # the rest is still in flight, instead of paying
+        # dex_fetch_time + pipeline_time sequentially.
+        queue: asyncio.Queue[tuple[TokenPair, SocialLinks] | None] = asyncio.Queue(
+            maxsize=256
+        )
 
-            # Step 3: Validate and enrich social links
-            self._service_attempts["social"] += 1
+        async def _produce() -> None:
             try:
-                socials = await self._social.validate_and_enrich(socials)
-            except Exception as e:
-                self._service_errors["social"] += 1
-                logger.warning("Social validation failed for %s: %s", token_pair.token_symbol, e)
-                await self._skip_token(
-                    token_pair=token_pair,
-                    poll_metrics=poll_metrics,
-                    reason_key="skipped_social_error",
-                    reason_message="social validation error",
-                    register_token=False,
-                )
-                continue
-
-            # Filter: Must have Telegram
-            if (
-                self._enforce_filters
-                and self._config.require_telegram_for_lead
-                and not socials.telegram_link
-            ):
-                await self._skip_token(
-                    token_pair=token_pair,
-                    poll_metrics=poll_metrics,
-                    reason_key="skipped_no_telegram",
-                    reason_message="no Telegram link",
-                )
-                continue
+                async for discovery in self._dex.iter_discoveries():
+                    await queue.put(discovery)
+            finally:
+                await queue.put(None)  # end-of-stream sentinel
 
-            # Step 4: Extract Telegram admins
-            admin_extraction_failed = False
-            admin_result = AdminResult(admins_hidden=not bool(socials.telegram_link))
-            if socials.telegram_link:
-                if self._telegram_admin_runtime_enabled:
-                    self._service_attempts["telegram_admin"] += 1
-                    try:
-                        admin_result = await self._tg_admin.extract_admins(
-                            socials.telegram_link
-                        )
-                    except Exception as e:
-                        self._service_errors["telegram_admin"] += 1
-                        self._telegram_admin_runtime_enabled = False
-                        self._telegram_admin_degraded = True
-                        admin_extraction_failed = True
-                        logger.warning(
-                            "Admin extraction failed for %s/%s: %s",
-                            token_pair.chain,
-                            token_pair.token_symbol,
-                            e,
-                        )
-                        logger.warning("Telegram admin extraction disabled for the current run")
-                        admin_result = AdminResult(admins_hidden=True)
+        self._service_attempts["dex"] += 1
+        producer = asyncio.create_task(_produce())
+
+        # Steps 3–6 are network-bound (social sites, Telethon, explorers), so
+        # run the per-token pipeline concurrently under a bounded semaphore
+        # instead of paying the sum of every token's latency sequentially.
+        sem = asyncio.Semaphore(self._config.lead_pipeline_concurrency)
+
+        async def _guarded(
+            token_pair: TokenPair, socials: SocialLinks
+        ) -> LeadRecord | None:
+            async with sem:
+                return await self._process_one(token_pair, socials, poll_metrics)
+
+        # Step 2: Drain the queue in micro-batches: drop keys the in-process
+        # seen-cache knows, resolve the rest with one bulk existence query
+        # per batch, and launch pipeline tasks for the genuinely new ones.
+        tasks: list[asyncio.Task[LeadRecord | None]] = []
+        draining = True
+        while draining:
+            batch = [await queue.get()]
+            while True:
+                try:
+                    batch.append(queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            if batch[-1] is None:
+                draining = False
+                batch.pop()
+            poll_metrics.discoveries += len(batch)
+
+            candidates: list[tuple[TokenPair, SocialLinks]] = []
+            for token_pair, socials in batch:
+                if self._is_seen(token_pair.chain, token_pair.token_address):
+                    # Silent skip for already processed tokens to keep logs clean
+                    poll_metrics.skipped_already_seen += 1
+                    self._metrics["skipped_total"] += 1
                 else:
-                    admin_result = AdminResult(admins_hidden=True)
-
-            # Enrich socials from Telegram group data (description, pinned message)
-            if admin_result.group_description or admin_result.pinned_message_text:
-                extra_text = (
-                    admin_result.group_description
-                    + "\n"
-                    + admin_result.pinned_message_text
-                )
-                extra_socials = SocialExtractor.extract_links_from_text(extra_text)
-
-                # Fill in missing links
-                if not socials.twitter_link and extra_socials.twitter_link:
-                    socials.twitter_link = extra_socials.twitter_link
-                    logger.info(
-                        "Found Twitter from TG group: %s", socials.twitter_link
-                    )
-                if not socials.website and extra_socials.website:
-                    socials.website = extra_socials.website
-                    logger.info("Found website from TG group: %s", socials.website)
-
-            # Filter: Must have at least one visible admin
-            if (
-                self._enforce_filters
-                and self._config.require_visible_admin_for_lead
-                and not admin_result.admins
-                and not admin_result.admins_hidden
-            ):
-                await self._skip_token(
-                    token_pair=token_pair,
-                    poll_metrics=poll_metrics,
-                    reason_key="skipped_no_visible_admins",
-                    reason_message="no visible admins",
-                    register_token=not (admin_extraction_failed or self._telegram_admin_degraded),
-                )
+                    candidates.append((token_pair, socials))
+            if not candidates:
                 continue
 
-            if (
-                self._enforce_filters
-                and self._config.reject_hidden_admins
-                and admin_result.admins_hidden
-                and not admin_result.admins
-            ):
-                await self._skip_token(
-                    token_pair=token_pair,
-                    poll_metrics=poll_metrics,
-                    reason_key="skipped_admins_hidden",
-                    reason_message="admins hidden",
-                    register_token=not (admin_extraction_failed or self._telegram_admin_degraded),
+            existing: frozenset[tuple[str, str]] | None = None
+            self._service_attempts["db"] += 1
+            try:
+                existing = await self._db.tokens_exist(
+                    [
+                        (token_pair.chain, token_pair.token_address.lower())
+                        for token_pair, _ in candidates
+                    ]
                 )
-                continue
+            except Exception as e:
+                self._service_errors["db"] += 1
+                logger.warning("Bulk existence check failed: %s", e)
 
-            # Step 5: Look up deployer wallet
-            deployer_wallet = None
-            if self._config.enable_wallet_lookup:
-                self._service_attempts["wallet"] += 1
-                try:
-                    deployer_wallet = await self._wallet.get_deployer(
-                        token_pair.chain, token_pair.token_address
-                    )
-                    poll_metrics["wallet_lookup_ok" if deployer_wallet else "wallet_lookup_miss"] += 1
-                except Exception as e:
-                    self._service_errors["wallet"] += 1
-                    poll_metrics["wallet_lookup_error"] += 1
-                    logger.warning(
-                        "Wallet lookup failed for %s/%s: %s",
+            for token_pair, socials in candidates:
+                if existing is not None:
+                    already_seen = (
                         token_pair.chain,
-                        token_pair.token_symbol,
-                        e,
+                        token_pair.token_address.lower(),
+                    ) in existing
+                else:
+                    # Fallback to the per-token lookup if the bulk query failed.
+                    already_seen = await self._db.token_exists(
+                        token_pair.chain, token_pair.token_address
                     )
+                if already_seen:
+                    # Silent skip for already processed tokens to keep logs clean
+                    self._mark_seen(token_pair.chain, token_pair.token_address)
+                    poll_metrics.skipped_already_seen += 1
+                    self._metrics["skipped_total"] += 1
+                    continue
+                tasks.append(asyncio.create_task(_guarded(token_pair, socials)))
+
+        await producer
+        logger.debug(
+            "Discovered %d potential leads within age window", poll_metrics.discoveries
+        )
 
-            # Step 6: Build full lead record
-            lead = LeadRecord(
-                chain=token_pair.chain,
-                token_name=token_pair.token_name,
-                token_symbol=token_pair.token_symbol,
-                token_address=token_pair.token_address,
-                pair_address=token_pair.pair_address,
-                dexscreener_url=token_pair.dexscreener_url,
-                pair_created_at=token_pair.pair_created_at,
-                telegram_link=socials.telegram_link,
-                twitter_link=socials.twitter_link,
-                website=socials.website,
-                admins=admin_result.admins,
-                admins_hidden=admin_result.admins_hidden,
-                deployer_wallet=deployer_wallet,
-            )
-
-            # Step 7: Persist to database
+        prepared: list[LeadRecord] = []
+        if tasks:
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+            for result in results:
+                if isinstance(result, BaseException):
+                    logger.error(
+                        "Lead pipeline task crashed: %s", result, exc_info=result
+                    )
+                elif result is not None:
+                    prepared.append(result)
+        # Step 7: Persist the whole poll's leads in one transaction — a single
+        # commit/fsync instead of one per lead.
+        stored: list[LeadRecord] = []
+        if prepared:
             self._service_attempts["db"] += 1
             try:
-                await self._db.insert_lead(lead)
+                token_ids = await self._db.insert_leads_many(prepared)
             except Exception as e:
                 self._service_errors["db"] += 1
-                logger.error(
-                    "Failed to persist lead for %s/%s: %s",
-                    lead.chain,
+                logger.error("Failed to persist lead batch: %s", e)
+                token_ids = [None] * len(prepared)
+            for lead, token_id in zip(prepared, token_ids):
+                if token_id is None:
+                    self._service_errors["db"] += 1
+                else:
+                    self._mark_seen(lead.chain, lead.token_address)
+                    stored.append(lead)
+
+        # Step 8: Hand stored leads to the notifier's background sender —
+        # Telegram latency and backoff no longer stall the poll loop.
+        # Outcomes come back through _on_notify_result, which folds them
+        # into the lifetime metrics rather than this poll's.
+        if stored:
+            self._service_attempts["notifier"] += 1
+            await self._notifier.enqueue_leads(stored)
+
+        for lead in stored:
+            poll_metrics.processed += 1
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "✅ Lead processed: %s/%s | Wallet: %s",
+                    lead.chain.upper(),
                     lead.token_symbol,
-                    e,
+                    "✓" if lead.deployer_wallet else "✗",
                 )
-                continue
 
-            # Step 8: Send notification
-            self._service_attempts["notifier"] += 1
-            try:
-                success = await self._notifier.send_lead(lead)
-            except Exception as e:
-                self._service_errors["notifier"] += 1
-                logger.error("Notification crashed for %s/%s: %s", lead.chain, lead.token_symbol, e)
-                success = False
-
-            poll_metrics["processed"] += 1
-            if success:
-                poll_metrics["notified"] += 1
-                self._service_attempts["db"] += 1
+        for f in fields(PollMetrics):
+            value = getattr(poll_metrics, f.name)
+            if value:
+                self._metrics[f.name] += value
+
+        # Summary lines build their arguments eagerly (sums, snapshots), so
+        # skip the work outright when INFO is filtered in production.
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Poll complete — discovered=%d processed=%d notified=%d skipped=%d",
+                poll_metrics.discoveries,
+                poll_metrics.processed,
+                poll_metrics.notified + poll_metrics.retried_notified,
+                poll_metrics.skipped_already_seen
+                + poll_metrics.skipped_no_telegram
+                + poll_metrics.skipped_no_visible_admins
+                + poll_metrics.skipped_admins_hidden
+                + poll_metrics.skipped_social_error,
+            )
+            # The multi-line health report is background noise at a fast
+            # poll interval; emit it on a configurable cadence.
+            if self._metrics["polls"] % self._config.health_log_every_polls == 0:
+                self._log_service_health()
+
+    async def _process_one(
+        self,
+        token_pair: TokenPair,
+        socials: SocialLinks,
+        poll_metrics: PollMetrics,
+    ) -> LeadRecord | None:
+        """
+        Enrich a single discovery (steps 3–6) and return its lead record,
+        or None when a filter or error drops it. Safe to run concurrently;
+        the shared poll_metrics counter is only mutated between awaits.
+        """
+        # Cheapest filter first: if there is no raw Telegram link and the
+        # filter would drop the lead anyway, skip the validation HTTP calls.
+        if (
+            self._enforce_filters
+            and self._config.require_telegram_for_lead
+            and not socials.telegram_link
+        ):
+            await self._skip_token(
+                token_pair=token_pair,
+                poll_metrics=poll_metrics,
+                reason_key="skipped_no_telegram",
+                reason_message="no Telegram link",
+            )
+            return None
+
+        # Step 3: Validate and enrich social links
+        self._service_attempts["social"] += 1
+        try:
+            socials = await self._social.validate_and_enrich(socials)
+        except Exception as e:
+            self._service_errors["social"] += 1
+            logger.warning("Social validation failed for %s: %s", token_pair.token_symbol, e)
+            await self._skip_token(
+                token_pair=token_pair,
+                poll_metrics=poll_metrics,
+                reason_key="skipped_social_error",
+                reason_message="social validation error",
+                register_token=False,
+            )
+            return None
+
+        # Filter: Must have Telegram
+        if (
+            self._enforce_filters
+            and self._config.require_telegram_for_lead
+            and not socials.telegram_link
+        ):
+            await self._skip_token(
+                token_pair=token_pair,
+                poll_metrics=poll_metrics,
+                reason_key="skipped_no_telegram",
+                reason_message="no Telegram link",
+            )
+            return None
+
+        # When admin extraction is off and hidden admins are rejected, every
+        # token with a Telegram group is doomed to the admins-hidden filter
+        # below — decide that now and skip the extraction scaffolding.
+        if (
+            self._enforce_filters
+            and self._config.reject_hidden_admins
+            and socials.telegram_link
+            and not self._telegram_admin_runtime_enabled
+        ):
+            await self._skip_token(
+                token_pair=token_pair,
+                poll_metrics=poll_metrics,
+                reason_key="skipped_admins_hidden",
+                reason_message="admins hidden",
+                register_token=not self._telegram_admin_degraded,
+            )
+            return None
+
+        # Step 4: Extract Telegram admins
+        admin_extraction_failed = False
+        admin_result = AdminResult(admins_hidden=not bool(socials.telegram_link))
+        if socials.telegram_link:
+            if self._telegram_admin_runtime_enabled:
+                self._service_attempts["telegram_admin"] += 1
                 try:
-                    await self._db.mark_notified(lead.chain, lead.token_address)
+                    async with self._tg_admin_sem:
+                        admin_result = await self._tg_admin.extract_admins(
+                            socials.telegram_link
+                        )
                 except Exception as e:
-                    self._service_errors["db"] += 1
+                    self._service_errors["telegram_admin"] += 1
+                    self._telegram_admin_runtime_enabled = False
+                    self._telegram_admin_degraded = True
+                    admin_extraction_failed = True
                     logger.warning(
-                        "Failed to mark notified for %s/%s: %s",
-                        lead.chain,
-                        lead.token_symbol,
+                        "Admin extraction failed for %s/%s: %s",
+                        token_pair.chain,
+                        token_pair.token_symbol,
                         e,
                     )
+                    logger.warning("Telegram admin extraction disabled for the current run")
+                    admin_result = _HIDDEN_ADMIN_RESULT
             else:
-                poll_metrics["notify_failed"] += 1
-                await self._record_notification_failure(lead, poll_metrics)
-
-            logger.info(
-                "✅ Lead processed: %s/%s | Wallet: %s",
-                lead.chain.upper(),
-                lead.token_symbol,
-                "✓" if lead.deployer_wallet else "✗",
+                admin_result = _HIDDEN_ADMIN_RESULT
+
+        # Enrich socials from Telegram group data (description, pinned message).
+        # Only worth mining when there is text to scan AND a link left to fill.
+        desc = admin_result.group_description
+        pin = admin_result.pinned_message_text
+        if (desc or pin) and (not socials.twitter_link or not socials.website):
+            extra_text = f"{desc}\n{pin}" if desc and pin else (desc or pin)
+            extra_socials = SocialExtractor.extract_links_from_text(extra_text)
+
+            # Fill in missing links
+            if not socials.twitter_link and extra_socials.twitter_link:
+                socials.twitter_link = extra_socials.twitter_link
+                logger.info(
+                    "Found Twitter from TG group: %s", socials.twitter_link
+                )
+            if not socials.website and extra_socials.website:
+                socials.website = extra_socials.website
+                logger.info("Found website from TG group: %s", socials.website)
+
+        # Filter: Must have at least one visible admin
+        if (
+            self._enforce_filters
+            and self._config.require_visible_admin_for_lead
+            and not admin_result.admins
+            and not admin_result.admins_hidden
+        ):
+            await self._skip_token(
+                token_pair=token_pair,
+                poll_metrics=poll_metrics,
+                reason_key="skipped_no_visible_admins",
+                reason_message="no visible admins",
+                register_token=not (admin_extraction_failed or self._telegram_admin_degraded),
             )
+            return None
+
+        if (
+            self._enforce_filters
+            and self._config.reject_hidden_admins
+            and admin_result.admins_hidden
+            and not admin_result.admins
+        ):
+            await self._skip_token(
+                token_pair=token_pair,
+                poll_metrics=poll_metrics,
+                reason_key="skipped_admins_hidden",
+                reason_message="admins hidden",
+                register_token=not (admin_extraction_failed or self._telegram_admin_degraded),
+            )
+            return None
 
-        for key, value in poll_metrics.items():
-            self._metrics[key] += value
+        # Step 5: Look up deployer wallet
+        deployer_wallet = None
+        if self._config.enable_wallet_lookup:
+            self._service_attempts["wallet"] += 1
+            try:
+                deployer_wallet = await self._wallet.get_deployer(
+                    token_pair.chain, token_pair.token_address
+                )
+                if deployer_wallet:
+                    poll_metrics.wallet_lookup_ok += 1
+                else:
+                    poll_metrics.wallet_lookup_miss += 1
+            except Exception as e:
+                self._service_errors["wallet"] += 1
+                poll_metrics.wallet_lookup_error += 1
+                logger.warning(
+                    "Wallet lookup failed for %s/%s: %s",
+                    token_pair.chain,
+                    token_pair.token_symbol,
+                    e,
+                )
 
-        logger.info(
-            "Poll complete — discovered=%d processed=%d notified=%d skipped=%d",
-            poll_metrics["discoveries"],
-            poll_metrics["processed"],
-            poll_metrics["notified"] + poll_metrics["retried_notified"],
-            poll_metrics["skipped_already_seen"]
-            + poll_metrics["skipped_no_telegram"]
-            + poll_metrics["skipped_no_visible_admins"]
-            + poll_metrics["skipped_admins_hidden"]
-            + poll_metrics["skipped_social_error"],
+        # Step 6: Build full lead record
+        return LeadRecord(
+            chain=token_pair.chain,
+            token_name=token_pair.token_name,
+            token_symbol=token_pair.token_symbol,
+            token_address=token_pair.token_address,
+            pair_address=token_pair.pair_address,
+            dexscreener_url=token_pair.dexscreener_url,
+            pair_created_at=token_pair.pair_created_at,
+            telegram_link=socials.telegram_link,
+            twitter_link=socials.twitter_link,
+            website=socials.website,
+            admins=admin_result.admins,
+            admins_hidden=admin_result.admins_hidden,
+            deployer_wallet=deployer_wallet,
         )
-        self._log_service_health()
 
     async def _skip_token(
         self,
         token_pair: TokenPair,
-        poll_metrics: Counter[str],
+        poll_metrics: PollMetrics,
         reason_key: str,
         reason_message: str,
         register_token: bool = True,
     ) -> None:
-        poll_metrics[reason_key] += 1
+        setattr(poll_metrics, reason_key, getattr(poll_metrics, reason_key) + 1)
         self._metrics["skipped_total"] += 1
         logger.info(
             "Skipping filter: %s/%s — %s",
@@ -439,7 +688,8 @@ class LeadBot:
                 dexscreener_url=token_pair.dexscreener_url,
                 pair_created_at=token_pair.pair_created_at,
             )
-            poll_metrics["registered_skipped"] += 1
+            self._mark_seen(token_pair.chain, token_pair.token_address)
+            poll_metrics.registered_skipped += 1
         except Exception as e:
             self._service_errors["db"] += 1
             logger.warning(
@@ -449,7 +699,54 @@ class LeadBot:
                 e,
             )
 
-    async def _retry_pending_notifications(self, poll_metrics: Counter[str]) -> None:
+    async def _on_notify_result(self, lead: LeadRecord, success: bool) -> None:
+        """
+        Background-sender callback: persist one notification outcome.
+
+        Runs after the poll that produced the lead has finished, so the
+        counters go straight into the lifetime metrics instead of a
+        per-poll snapshot.
+        """
+        key = (lead.chain, lead.token_address.lower())
+        is_retry = key in self._notify_retry_inflight
+        self._notify_retry_inflight.discard(key)
+
+        counters = PollMetrics()
+        if success:
+            if is_retry:
+                counters.retried_notified += 1
+            else:
+                counters.notified += 1
+            self._service_attempts["db"] += 1
+            try:
+                await self._db.mark_notified(lead.chain, lead.token_address)
+            except Exception as e:
+                self._service_errors["db"] += 1
+                logger.warning(
+                    "Failed to mark notified for %s/%s: %s",
+                    lead.chain,
+                    lead.token_symbol,
+                    e,
+                )
+        else:
+            if is_retry:
+                counters.retried_notify_failed += 1
+            else:
+                counters.notify_failed += 1
+            await self._record_notification_failure(lead, counters)
+
+        for f in fields(PollMetrics):
+            value = getattr(counters, f.name)
+            if value:
+                self._metrics[f.name] += value
+
+    async def _retry_pending_notifications(self) -> None:
+        """
+        Hand due retries to the background sender, like fresh leads — one
+        failing send must never stall the poll loop for its full backoff.
+        Outcomes come back through _on_notify_result, which counts them
+        under the retried_* metrics and updates the DB retry queue.
+        """
         self._service_attempts["db"] += 1
         try:
             pending = await self._db.get_unnotified_leads(
@@ -460,45 +757,24 @@ class LeadBot:
             logger.warning("Failed to load pending notifications: %s", e)
             return
 
-        if not pending:
-            return
-
-        logger.info("Retrying %d pending notifications", len(pending))
+        # Skip leads still queued from an earlier poll whose outcome
+        # hasn't landed yet — re-enqueueing would send duplicates.
+        to_send: list[LeadRecord] = []
         for lead in pending:
-            self._service_attempts["notifier"] += 1
-            try:
-                success = await self._notifier.send_lead(lead)
-            except Exception as e:
-                self._service_errors["notifier"] += 1
-                poll_metrics["retried_notify_failed"] += 1
-                logger.error(
-                    "Retry notification crashed for %s/%s: %s",
-                    lead.chain,
-                    lead.token_symbol,
-                    e,
-                )
+            key = (lead.chain, lead.token_address.lower())
+            if key in self._notify_retry_inflight:
                 continue
+            self._notify_retry_inflight.add(key)
+            to_send.append(lead)
+        if not to_send:
+            return
 
-            if not success:
-                poll_metrics["retried_notify_failed"] += 1
-                await self._record_notification_failure(lead, poll_metrics)
-                continue
-
-            poll_metrics["retried_notified"] += 1
-            self._service_attempts["db"] += 1
-            try:
-                await self._db.mark_notified(lead.chain, lead.token_address)
-            except Exception as e:
-                self._service_errors["db"] += 1
-                logger.warning(
-                    "Failed to mark retried notification as sent for %s/%s: %s",
-                    lead.chain,
-                    lead.token_symbol,
-                    e,
-                )
+        logger.info("Retrying %d pending notifications", len(to_send))
+        self._service_attempts["notifier"] += 1
+        await self._notifier.enqueue_leads(to_send)
 
     async def _record_notification_failure(
-        self, lead: LeadRecord, poll_metrics: Counter[str]
+        self, lead: LeadRecord, poll_metrics: PollMetrics
     ) -> None:
         self._service_attempts["db"] += 1
         try:
@@ -521,7 +797,7 @@ class LeadBot:
             return
 
         if scheduled and next_retry_at is not None:
-            poll_metrics["notify_retry_scheduled"] += 1
+            poll_metrics.notify_retry_scheduled += 1
             logger.warning(
                 "Notification failed for %s/%s (attempt %d/%d); retry scheduled at %s",
                 lead.chain,
@@ -532,7 +808,7 @@ class LeadBot:
             )
             return
 
-        poll_metrics["notify_dead_lettered"] += 1
+        poll_metrics.notify_dead_lettered += 1
         logger.error(
             "Notification dead-lettered for %s/%s after %d attempts",
             lead.chain,
@@ -541,15 +817,19 @@ class LeadBot:
         )
 
     def _log_service_health(self) -> None:
+        if not logger.isEnabledFor(logging.INFO):
+            # Everything below is INFO-level; don't build the snapshot dict
+            # or the sorted service list just to throw them away.
+            return
         services = sorted(set(self._service_attempts) | set(self._service_errors))
         dex_metrics = self._dex.metrics_snapshot()
         logger.info(
             "Dex metrics: profile_calls=%d pair_calls=%d retries=%d pair_failures=%d parse_failures=%d",
-            dex_metrics["profile_calls"],
-            dex_metrics["pair_calls"],
-            dex_metrics["retry_events"],
-            dex_metrics["pair_failures"],
-            dex_metrics["parse_failures"],
+            dex_metrics.profile_calls,
+            dex_metrics.pair_calls,
+            dex_metrics.retry_events,
+            dex_metrics.pair_failures,
+            dex_metrics.parse_failures,
         )
         for service in services:
             attempts = self._service_attempts[service]
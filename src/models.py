@@ -1,16 +1,20 @@
 """
-Pydantic data models used across the application.
+Data models used across the application.
+
+Plain slotted dataclasses: these objects are internal, trusted data built
+in the per-discovery hot path, so they skip per-field validation and dict
+attribute storage entirely.
 """
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
+from dataclasses import dataclass, field
+from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel, Field
-
 
-class TokenPair(BaseModel):
+@dataclass(slots=True)
+class TokenPair:
     """Core data for a newly discovered Dexscreener pair."""
 
     chain: str
@@ -18,14 +22,15 @@ class TokenPair(BaseModel):
     token_symbol: str
     token_address: str
     pair_address: str
-    dex_id: str = ""
     dexscreener_url: str
     pair_created_at: datetime
+    dex_id: str = ""
     liquidity_usd: float = 0.0
     fdv: float = 0.0
 
 
-class SocialLinks(BaseModel):
+@dataclass(slots=True)
+class SocialLinks:
     """Extracted social links for a token."""
 
     telegram_link: Optional[str] = None
@@ -33,31 +38,35 @@ class SocialLinks(BaseModel):
     website: Optional[str] = None
 
 
-class TelegramAdmin(BaseModel):
+@dataclass(slots=True)
+class TelegramAdmin:
     """A Telegram group admin."""
 
     username: str
     is_creator: bool = False
 
 
-class AdminResult(BaseModel):
+@dataclass(slots=True)
+class AdminResult:
     """Result of admin extraction for a Telegram group."""
 
-    admins: list[TelegramAdmin] = Field(default_factory=list)
+    admins: list[TelegramAdmin] = field(default_factory=list)
     admins_hidden: bool = False
     group_title: str = ""
     group_description: str = ""
     pinned_message_text: str = ""
 
 
-class DeployerWallet(BaseModel):
+@dataclass(slots=True)
+class DeployerWallet:
     """Deployer wallet information."""
 
     address: str
     chain: str
 
 
-class LeadRecord(BaseModel):
+@dataclass(slots=True)
+class LeadRecord:
     """Full lead record combining all extracted intelligence."""
 
     # Token info
@@ -75,12 +84,19 @@ class LeadRecord(BaseModel):
     website: Optional[str] = None
 
     # Admins
-    admins: list[TelegramAdmin] = Field(default_factory=list)
+    admins: list[TelegramAdmin] = field(default_factory=list)
     admins_hidden: bool = False
 
     # Wallet
     deployer_wallet: Optional[str] = None
 
-    # Metadata
-    discovered_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    # Metadata. discovered_at defaults server-side (the tokens column has
+    # DEFAULT datetime('now')), so no datetime is allocated per lead unless
+    # a caller supplies one.
+    discovered_at: Optional[datetime] = None
     notified: bool = False
+
+    def __post_init__(self) -> None:
+        # Canonical lowercase form — the persistence layer keys dedup on it,
+        # so normalize once here instead of at every query site.
+        self.token_address = self.token_address.lower()
@@ -5,54 +5,173 @@ Sends formatted lead messages to a private Telegram channel.
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from html import escape as html_escape
+import random
+import re
+from functools import lru_cache
+from typing import Awaitable, Callable, Optional
 from urllib.parse import urlparse
 
 from telegram import Bot
 from telegram.constants import ParseMode
-from telegram.error import RetryAfter, TelegramError
+from telegram.error import BadRequest, Forbidden, RetryAfter, TelegramError
 
 from .config import Config
 from .models import LeadRecord
 
 logger = logging.getLogger("dexbot.notifier")
 
+# Most escaped fields (addresses, symbols, URLs) contain no HTML special
+# characters at all, so scan first and only allocate when something needs
+# replacing. The table mirrors html.escape(quote=True) output exactly.
+_ESC_SEARCH = re.compile(r"[&<>\"']").search
+_ESC_TABLE = str.maketrans(
+    {"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#x27;"}
+)
+
+# Built once at import time; _format_message runs for every lead.
+CHAIN_EMOJI = {
+    "ethereum": "⟠",
+    "bsc": "🟡",
+    "base": "🔵",
+    "solana": "🟣",
+}
+_MSG_HEADER = "🚀 <b>New Dexscreener Lead Detected</b>\n\n"
+
 
 class Notifier:
     """Sends formatted lead notifications to a Telegram channel."""
 
+    # Telegram caps messages at 4096 chars; leave headroom for the divider.
+    _MAX_BATCH_CHARS = 3800
+    _LEAD_DIVIDER = "\n➖➖➖➖➖➖➖➖➖➖\n\n"
+
+    # Bounded so a long Telegram outage eventually backpressures the poll
+    # loop instead of buffering leads without limit.
+    _QUEUE_MAX_BATCHES = 1000
+
     def __init__(self, config: Config):
         self._config = config
         self._bot = Bot(token=config.telegram_bot_token)
         self._channel_id = config.telegram_channel_id
+        self._queue: Optional[asyncio.Queue[Optional[list[LeadRecord]]]] = None
+        self._worker_task: Optional[asyncio.Task] = None
+        self._on_result: Optional[Callable[[LeadRecord, bool], Awaitable[None]]] = None
+
+    def start(self, on_result: Callable[[LeadRecord, bool], Awaitable[None]]) -> None:
+        """
+        Spawn the background sender. on_result is awaited once per lead with
+        the send outcome, after the worker finishes that lead's batch.
+        """
+        if self._worker_task is not None:
+            return
+        self._on_result = on_result
+        self._queue = asyncio.Queue(maxsize=self._QUEUE_MAX_BATCHES)
+        self._worker_task = asyncio.create_task(self._worker())
+
+    async def stop(self) -> None:
+        """Drain queued batches and stop the background sender."""
+        if self._worker_task is None:
+            return
+        assert self._queue is not None
+        await self._queue.put(None)
+        await self._worker_task
+        self._worker_task = None
+        self._queue = None
+
+    async def enqueue_leads(self, leads: list[LeadRecord]) -> None:
+        """
+        Queue a batch for the background sender, so Telegram latency and
+        backoff never stall the caller. Blocks only when the queue is full.
+        """
+        if self._queue is None:
+            raise RuntimeError("Notifier.start() must be called before enqueue_leads()")
+        await self._queue.put(leads)
+
+    async def _worker(self) -> None:
+        assert self._queue is not None
+        while True:
+            batch = await self._queue.get()
+            if batch is None:
+                return
+            try:
+                results = await self.send_leads(batch)
+            except Exception as e:
+                logger.error("Notification batch crashed: %s", e)
+                results = [False] * len(batch)
+            if self._on_result is not None:
+                for lead, ok in zip(batch, results):
+                    try:
+                        await self._on_result(lead, ok)
+                    except Exception as e:
+                        logger.error(
+                            "Notification result callback failed for %s/%s: %s",
+                            lead.chain,
+                            lead.token_symbol,
+                            e,
+                        )
 
     async def send_lead(self, lead: LeadRecord) -> bool:
         """
         Send a formatted lead notification to the configured channel.
         Returns True if sent successfully.
         """
-        message = self._format_message(lead)
-
-        try:
-            await self._bot.send_message(
-                chat_id=self._channel_id,
-                text=message,
-                parse_mode=ParseMode.HTML,
-                disable_web_page_preview=True,
-            )
+        if await self._send_text(self._format_message(lead)):
             logger.info(
                 "Notification sent for %s/%s",
                 lead.chain.upper(),
                 lead.token_symbol,
             )
             return True
+        return False
+
+    async def send_leads(self, leads: list[LeadRecord]) -> list[bool]:
+        """
+        Send a batch of leads, coalescing consecutive messages into as few
+        sendMessage calls as the 4096-char limit allows. Returns one success
+        flag per lead, in order; all leads sharing a merged message get the
+        outcome of that one call.
+        """
+        results: list[bool] = []
+        batch: list[str] = []
+        batch_chars = 0
+
+        async def _flush() -> None:
+            nonlocal batch, batch_chars
+            if not batch:
+                return
+            ok = await self._send_text(self._LEAD_DIVIDER.join(batch))
+            if ok:
+                logger.info("Notification batch of %d leads sent", len(batch))
+            results.extend([ok] * len(batch))
+            batch = []
+            batch_chars = 0
 
-        except RetryAfter as e:
-            logger.warning("Rate limited by Telegram — retry after %d sec", e.retry_after)
-            import asyncio
-            await asyncio.sleep(e.retry_after)
-            # Retry once
+        for lead in leads:
+            message = self._format_message(lead)
+            if batch and batch_chars + len(message) > self._MAX_BATCH_CHARS:
+                await _flush()
+            batch.append(message)
+            batch_chars += len(message) + len(self._LEAD_DIVIDER)
+        await _flush()
+
+        return results
+
+    # In-process send attempts before handing the lead to the DB retry
+    # queue; backoff is capped so a bad stretch never stalls for long.
+    _SEND_MAX_ATTEMPTS = 8
+    _SEND_MAX_BACKOFF = 30.0
+
+    async def _send_text(self, message: str) -> bool:
+        """
+        One logical send with exponential backoff and jitter.
+
+        RetryAfter sleeps for the interval Telegram asked for; other
+        TelegramErrors (network blips, 5xx) back off exponentially. Jitter
+        desynchronizes retries when several sends fail at once.
+        """
+        for attempt in range(self._SEND_MAX_ATTEMPTS):
             try:
                 await self._bot.send_message(
                     chat_id=self._channel_id,
@@ -61,61 +180,84 @@ class Notifier:
                     disable_web_page_preview=True,
                 )
                 return True
-            except Exception as retry_err:
-                logger.error("Retry failed: %s", retry_err)
+
+            except RetryAfter as e:
+                logger.warning(
+                    "Rate limited by Telegram — retry after %d sec", e.retry_after
+                )
+                delay = e.retry_after + random.uniform(0, 1)
+
+            except (BadRequest, Forbidden) as e:
+                # Non-transient: a malformed message or a chat we can't post
+                # to fails identically on every attempt, so retrying only
+                # burns the backoff budget. The DB retry queue keeps the lead.
+                logger.error("Notification rejected by Telegram: %s", e)
                 return False
 
-        except TelegramError as e:
-            logger.error("Failed to send notification: %s", e)
-            return False
+            except TelegramError as e:
+                logger.error(
+                    "Failed to send notification (attempt %d/%d): %s",
+                    attempt + 1,
+                    self._SEND_MAX_ATTEMPTS,
+                    e,
+                )
+                delay = min(2.0**attempt, self._SEND_MAX_BACKOFF) + random.uniform(0, 1)
+
+            if attempt + 1 < self._SEND_MAX_ATTEMPTS:
+                await asyncio.sleep(delay)
+
+        return False
 
     @staticmethod
     def _format_message(lead: LeadRecord) -> str:
         """Format the lead into a Telegram HTML message."""
+        # One join over a parts list instead of chained f-string
+        # concatenation: a single sized allocation, and all static
+        # fragments are module-level constants.
+        parts = [
+            _MSG_HEADER,
+            CHAIN_EMOJI.get(lead.chain, "🔗"),
+            " <b>Chain:</b> ", _escape(lead.chain.upper()), "\n",
+            "📛 <b>Name:</b> ", _escape(lead.token_name), "\n",
+            "🏷 <b>Symbol:</b> $", _escape(lead.token_symbol), "\n",
+            "📋 <b>Contract:</b> <code>", _escape(lead.token_address), "</code>\n\n",
+        ]
 
-        # Chain emoji mapping
-        chain_emoji = {
-            "ethereum": "⟠",
-            "bsc": "🟡",
-            "base": "🔵",
-            "solana": "🟣",
-        }
-        emoji = chain_emoji.get(lead.chain, "🔗")
-
-        social_lines = []
+        has_socials = False
         if lead.telegram_link:
-            social_lines.append(f"💬 <b>Telegram:</b> {_format_link(lead.telegram_link)}")
+            parts += ("💬 <b>Telegram:</b> ", _format_link(lead.telegram_link), "\n")
+            has_socials = True
         if lead.twitter_link:
-            social_lines.append(f"🐦 <b>Twitter:</b> {_format_link(lead.twitter_link)}")
+            parts += ("🐦 <b>Twitter:</b> ", _format_link(lead.twitter_link), "\n")
+            has_socials = True
         if lead.website:
-            social_lines.append(f"🌐 <b>Website:</b> {_format_link(lead.website)}")
+            parts += ("🌐 <b>Website:</b> ", _format_link(lead.website), "\n")
+            has_socials = True
+        if has_socials:
+            parts.append("\n")
 
-        social_section = ""
-        if social_lines:
-            social_section = "\n".join(social_lines) + "\n\n"
-
-        message = (
-            f"🚀 <b>New Dexscreener Lead Detected</b>\n"
-            f"\n"
-            f"{emoji} <b>Chain:</b> {_escape(lead.chain.upper())}\n"
-            f"📛 <b>Name:</b> {_escape(lead.token_name)}\n"
-            f"🏷 <b>Symbol:</b> ${_escape(lead.token_symbol)}\n"
-            f"📋 <b>Contract:</b> <code>{_escape(lead.token_address)}</code>\n"
-            f"\n"
-            f"{social_section}"
-            f"{_format_wallet_section(lead.deployer_wallet)}"
-            f"📊 <b>Dexscreener:</b>\n"
-            f"{_format_link(lead.dexscreener_url)}\n"
-        )
+        if lead.deployer_wallet:
+            parts += (
+                "💳 <b>Deployer Wallet:</b>\n<code>",
+                _escape(lead.deployer_wallet),
+                "</code>\n\n",
+            )
 
-        return message
+        parts += ("📊 <b>Dexscreener:</b>\n", _format_link(lead.dexscreener_url), "\n")
+        return "".join(parts)
 
 
+# The same chain names, symbols and links recur across leads and across
+# retries of the same lead, so both pure helpers are memoized.
+@lru_cache(maxsize=4096)
 def _escape(text: str) -> str:
-    """Escape HTML special characters."""
-    return html_escape(text, quote=True)
+    """Escape HTML special characters; clean input is returned as-is."""
+    if not text or _ESC_SEARCH(text) is None:
+        return text
+    return text.translate(_ESC_TABLE)
 
 
+@lru_cache(maxsize=4096)
 def _format_link(url: str | None) -> str:
     if not url:
         return ""
@@ -125,11 +267,3 @@ def _format_link(url: str | None) -> str:
     safe_url = _escape(url)
     return f'<a href="{safe_url}">{safe_url}</a>'
 
-
-def _format_wallet_section(wallet: str | None) -> str:
-    if not wallet:
-        return ""
-    return (
-        "💳 <b>Deployer Wallet:</b>\n"
-        f"<code>{_escape(wallet)}</code>\n\n"
-    )
@@ -5,38 +5,126 @@ Validates Telegram links, Twitter/X links, and website URLs.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import re
+import time
+from collections import OrderedDict
 from urllib.parse import urlparse
 
 import httpx
 
 from .models import SocialLinks
-from .utils import rate_limiters
+from .utils import extract_domain, rate_limiters
 
 logger = logging.getLogger("dexbot.social")
 
-# Regex patterns
+# Regex patterns — compiled once at import; extract_links_from_text runs
+# once per discovery, so per-call re.compile would be pure interpreter cost.
 TG_LINK_PATTERN = re.compile(r"https?://t\.me/([A-Za-z0-9_]+)")
 TWITTER_PATTERN = re.compile(r"https?://(?:twitter\.com|x\.com)/([A-Za-z0-9_]+)")
+URL_PATTERN = re.compile(r"https?://[^\s<>\"']+")
 
+# One alternation over the three link shapes so free-form text (group
+# descriptions, pinned messages) is scanned once, not once per pattern.
+# Order matters: the specific shapes must win over the generic URL.
+_TEXT_LINK_SCAN = re.compile(
+    rf"(?P<tg>{TG_LINK_PATTERN.pattern})"
+    rf"|(?P<tw>{TWITTER_PATTERN.pattern})"
+    rf"|(?P<url>{URL_PATTERN.pattern})"
+)
 
-class SocialExtractor:
-    """Validates and enriches social links."""
+# Domains that are social links, not project websites — one C-level
+# multi-pattern scan instead of a Python loop of substring tests.
+_SOCIAL_DOMAIN_SEARCH = re.compile(
+    r"t\.me|twitter\.com|x\.com|telegram\.org|discord"
+).search
 
-    def __init__(self, strict_validation: bool = False):
-        self._strict_validation = strict_validation
-        self._client = httpx.AsyncClient(
-            timeout=httpx.Timeout(10.0),
+# t.me paths that are features, not groups/channels.
+_TG_RESERVED_NAMES = frozenset({"share", "addstickers", "joinchat", "proxy", "socks"})
+
+# Group-page markers near the top of t.me HTML; matched on raw bytes so
+# validation never decodes or lowercases the body.
+_TG_PAGE_SENTINEL = re.compile(rb"tgme_page|members|subscribers", re.IGNORECASE).search
+
+# How much of a t.me page to read before giving up on the markers.
+_TG_PROBE_BYTES = 4096
+
+# Probe results are memoized per URL — the same t.me group reappears when
+# a token is relisted or shared across tokens. TTL keeps a group that goes
+# private from staying "valid" forever; the cap bounds memory.
+_VALIDATION_TTL_SECONDS = 3600.0
+_VALIDATION_CACHE_MAX = 10_000
+
+
+def _is_canonical_telegram(url: str) -> bool:
+    """True for a plain t.me/<group> link that names an actual group."""
+    match = TG_LINK_PATTERN.fullmatch(url)
+    return match is not None and match.group(1).lower() not in _TG_RESERVED_NAMES
+
+
+# Process-wide HTTP client. TLS setup dominates these short probes, so
+# every extractor shares one pool (with HTTP/2 multiplexing where the
+# server offers it) instead of opening per-instance connections.
+_SHARED_CLIENT: httpx.AsyncClient | None = None
+
+
+def _get_shared_client() -> httpx.AsyncClient:
+    """Return the shared client, creating it lazily after a close."""
+    global _SHARED_CLIENT
+    if _SHARED_CLIENT is None or _SHARED_CLIENT.is_closed:
+        _SHARED_CLIENT = httpx.AsyncClient(
+            http2=True,
+            timeout=httpx.Timeout(10.0, connect=3.0),
             follow_redirects=True,
             headers={
                 "User-Agent": "Mozilla/5.0 (compatible; DexBot/1.0)",
             },
+            # Keep connections to t.me/x.com warm across polls so repeat
+            # validations skip the TCP/TLS handshake.
+            limits=httpx.Limits(
+                max_connections=50,
+                max_keepalive_connections=25,
+                keepalive_expiry=75.0,
+            ),
         )
+    return _SHARED_CLIENT
+
+
+class SocialExtractor:
+    """Validates and enriches social links."""
+
+    def __init__(self, strict_validation: bool = False):
+        self._strict_validation = strict_validation
         self._limiter = rate_limiters.get("social_http", max_calls=10, period=1.0)
+        self._validation_cache: OrderedDict[str, tuple[float, bool]] = OrderedDict()
+
+    def _cached_validation(self, url: str) -> bool | None:
+        """Return a fresh cached probe result for url, or None on a miss."""
+        hit = self._validation_cache.get(url)
+        if hit is None:
+            return None
+        if time.monotonic() - hit[0] >= _VALIDATION_TTL_SECONDS:
+            del self._validation_cache[url]
+            return None
+        self._validation_cache.move_to_end(url)
+        return hit[1]
+
+    def _store_validation(self, url: str, result: bool) -> None:
+        self._validation_cache[url] = (time.monotonic(), result)
+        self._validation_cache.move_to_end(url)
+        while len(self._validation_cache) > _VALIDATION_CACHE_MAX:
+            self._validation_cache.popitem(last=False)
+
+    @property
+    def _client(self) -> httpx.AsyncClient:
+        return _get_shared_client()
 
     async def close(self) -> None:
-        await self._client.aclose()
+        global _SHARED_CLIENT
+        if _SHARED_CLIENT is not None and not _SHARED_CLIENT.is_closed:
+            await _SHARED_CLIENT.aclose()
+        _SHARED_CLIENT = None
 
     async def validate_telegram_link(self, url: str) -> bool:
         """
@@ -50,27 +138,40 @@ class SocialExtractor:
         group_name = match.group(1)
 
         # Skip known non-group links
-        if group_name.lower() in ("share", "addstickers", "joinchat", "proxy", "socks"):
+        if group_name.lower() in _TG_RESERVED_NAMES:
             return False
 
+        cached = self._cached_validation(url)
+        if cached is not None:
+            return cached
+
         try:
             async with self._limiter:
-                resp = await self._client.get(url)
-            # Telegram returns 200 for valid public groups
-            if resp.status_code == 200:
-                # Check page content for group indicators
-                text = resp.text.lower()
-                # If the page has "join" or "members" it's likely a valid group
-                if any(kw in text for kw in ["tgme_page", "members", "subscribers"]):
-                    logger.debug("Telegram link validated: %s", url)
-                    return True
-                # Even 200 with no specific indicators — assume valid
-                return True
-            return False
+                # Stream instead of a full GET: t.me pages run 30-80 KB and
+                # the group markers sit in the first few KB, so stop reading
+                # (and close the stream) as soon as we have an answer.
+                async with self._client.stream("GET", url) as resp:
+                    # Telegram returns 200 for valid public groups
+                    if resp.status_code == 200:
+                        buf = b""
+                        async for chunk in resp.aiter_bytes(_TG_PROBE_BYTES):
+                            buf += chunk
+                            if _TG_PAGE_SENTINEL(buf):
+                                logger.debug("Telegram link validated: %s", url)
+                                break
+                            if len(buf) >= _TG_PROBE_BYTES:
+                                break
+                        # Even 200 with no specific indicators — assume valid
+                        result = True
+                    else:
+                        result = False
         except Exception as e:
             logger.warning("Failed to validate Telegram link %s: %s", url, e)
             return False
 
+        self._store_validation(url, result)
+        return result
+
     async def validate_twitter_link(self, url: str) -> bool:
         """
         Validate a Twitter/X link by checking HTTP status.
@@ -78,15 +179,22 @@ class SocialExtractor:
         if not url:
             return False
 
+        cached = self._cached_validation(url)
+        if cached is not None:
+            return cached
+
         try:
             async with self._limiter:
                 resp = await self._client.head(url)
-            return resp.status_code in (200, 301, 302, 303, 307, 308)
+            result = resp.status_code in (200, 301, 302, 303, 307, 308)
         except Exception as e:
             logger.debug("Twitter link validation failed for %s: %s", url, e)
             # Don't discard — Twitter often blocks automated checks
             return True  # Assume valid if we got the link from Dexscreener
 
+        self._store_validation(url, result)
+        return result
+
     async def validate_and_enrich(self, socials: SocialLinks) -> SocialLinks:
         """
         Validate all social links. Discard invalid ones.
@@ -95,17 +203,27 @@ class SocialExtractor:
         twitter = socials.twitter_link
         website = socials.website
 
-        # Validate Telegram
-        if telegram and not await self.validate_telegram_link(telegram):
+        # A canonical t.me/<group> link straight from the Dexscreener
+        # payload is trusted without a liveness probe unless strict
+        # validation is on — that is the common case and saves one HTTP
+        # round-trip per discovery. Outside strict mode the Twitter probe
+        # result was never acted on (soft validation keeps the link either
+        # way), so only strict mode pays for that call. When both probes
+        # are needed they run concurrently — the rate limiter provides the
+        # backpressure — so a lead pays one round-trip of latency, not two.
+        tg_task = None
+        if telegram and (self._strict_validation or not _is_canonical_telegram(telegram)):
+            tg_task = asyncio.create_task(self.validate_telegram_link(telegram))
+        tw_task = None
+        if twitter and self._strict_validation:
+            tw_task = asyncio.create_task(self.validate_twitter_link(twitter))
+
+        if tg_task is not None and not await tg_task:
             logger.info("Invalid Telegram link discarded: %s", telegram)
             telegram = None
-
-        # Validate Twitter (soft validation)
-        if twitter:
-            is_valid_twitter = await self.validate_twitter_link(twitter)
-            if self._strict_validation and not is_valid_twitter:
-                logger.info("Invalid Twitter/X link discarded in strict mode: %s", twitter)
-                twitter = None
+        if tw_task is not None and not await tw_task:
+            logger.info("Invalid Twitter/X link discarded in strict mode: %s", twitter)
+            twitter = None
 
         # Normalize website to domain
         if website:
@@ -120,16 +238,9 @@ class SocialExtractor:
     @staticmethod
     def _normalize_website(url: str) -> str:
         """Normalize URL to root domain."""
-        try:
-            if not url.startswith("http"):
-                url = "https://" + url
-            parsed = urlparse(url)
-            domain = parsed.netloc or parsed.path
-            if domain.startswith("www."):
-                domain = domain[4:]
-            return domain.split(":")[0].lower()
-        except Exception:
-            return url
+        if not url.startswith("http"):
+            url = "https://" + url
+        return extract_domain(url) or url
 
     @staticmethod
     def extract_links_from_text(text: str) -> SocialLinks:
@@ -141,28 +252,22 @@ class SocialExtractor:
         twitter = None
         website = None
 
-        tg_match = TG_LINK_PATTERN.search(text)
-        if tg_match:
-            telegram = tg_match.group(0)
-
-        tw_match = TWITTER_PATTERN.search(text)
-        if tw_match:
-            twitter = tw_match.group(0)
-
-        # Generic website detection (http/https links that aren't social)
-        url_pattern = re.compile(r"https?://[^\s<>\"']+")
-        for match in url_pattern.finditer(text):
-            url = match.group(0).rstrip(".,!)")
-            parsed = urlparse(url)
-            domain = parsed.netloc.lower()
-            # Skip known social domains
-            if any(
-                s in domain
-                for s in ["t.me", "twitter.com", "x.com", "telegram.org", "discord"]
-            ):
-                continue
-            if not website:
-                website = url
+        for match in _TEXT_LINK_SCAN.finditer(text):
+            kind = match.lastgroup
+            if kind == "tg":
+                if telegram is None:
+                    telegram = match.group(0)
+            elif kind == "tw":
+                if twitter is None:
+                    twitter = match.group(0)
+            elif website is None:
+                # Generic website detection (http/https links that aren't social)
+                url = match.group(0).rstrip(".,!)")
+                domain = urlparse(url).netloc.lower()
+                if _SOCIAL_DOMAIN_SEARCH(domain) is None:
+                    website = url
+            if telegram and twitter and website:
+                break
 
         return SocialLinks(
             telegram_link=telegram,
@@ -12,7 +12,8 @@ from __future__ import annotations
 import asyncio
 import logging
 import re
-from typing import Optional
+from collections import OrderedDict
+from typing import Any, Optional
 
 from telethon import TelegramClient
 from telethon.errors import (
@@ -30,6 +31,7 @@ from telethon.tl.functions.messages import GetFullChatRequest
 from telethon.tl.types import (
     ChannelParticipantCreator,
     ChannelParticipantsAdmins,
+    InputMessagesFilterPinned,
 )
 
 from .config import Config
@@ -39,6 +41,23 @@ logger = logging.getLogger("dexbot.tg_admin")
 
 TG_USERNAME_PATTERN = re.compile(r"https?://t\.me/([A-Za-z0-9_]+)")
 
+_SESSION_NAME = "dexbot_session"
+
+# The Telethon session is a SQLite file: two clients opening it at once
+# contend on (or corrupt) it. Share one refcounted client per
+# (api_id, session) so every extractor reuses the same warm MTProto
+# connection and entity cache; the last disconnect tears it down.
+_shared_clients: dict[tuple[int, str], TelegramClient] = {}
+_shared_refcounts: dict[tuple[int, str], int] = {}
+_shared_lock = asyncio.Lock()
+
+# Resolved entities per normalized username. ResolveUsername RPCs are the
+# calls most likely to trigger FloodWaitError, and the same group recurs
+# across tokens, so remember both good entities and permanently-bad
+# usernames (marked with a sentinel).
+_ENTITY_CACHE_MAX = 2048
+_BAD_ENTITY = object()
+
 
 class TelegramAdminExtractor:
     """Extracts admin information from Telegram groups/channels using Telethon."""
@@ -47,31 +66,59 @@ class TelegramAdminExtractor:
         self._config = config
         self._enabled = config.telegram_admin_enabled
         self._client: Optional[TelegramClient] = None
+        self._client_key: Optional[tuple[int, str]] = None
         self._connected = False
+        self._entity_cache: OrderedDict[str, Any] = OrderedDict()
+
+    def _cache_entity(self, username_key: str, entity: Any) -> None:
+        self._entity_cache[username_key] = entity
+        self._entity_cache.move_to_end(username_key)
+        while len(self._entity_cache) > _ENTITY_CACHE_MAX:
+            self._entity_cache.popitem(last=False)
 
     async def connect(self) -> None:
-        """Initialize and connect the Telethon client."""
+        """Attach to the shared Telethon client, connecting it on first use."""
         if not self._enabled:
             return
         if self._connected:
             return
 
-        self._client = TelegramClient(
-            "dexbot_session",
-            self._config.telegram_api_id,
-            self._config.telegram_api_hash,
-        )
-
-        await self._client.start(phone=self._config.telegram_phone)
+        key = (self._config.telegram_api_id, _SESSION_NAME)
+        async with _shared_lock:
+            client = _shared_clients.get(key)
+            if client is None:
+                client = TelegramClient(
+                    _SESSION_NAME,
+                    self._config.telegram_api_id,
+                    self._config.telegram_api_hash,
+                )
+                _shared_clients[key] = client
+                _shared_refcounts[key] = 0
+            if not client.is_connected():
+                await client.start(phone=self._config.telegram_phone)
+                logger.info("Telethon client connected")
+            _shared_refcounts[key] += 1
+
+        self._client = client
+        self._client_key = key
         self._connected = True
-        logger.info("Telethon client connected")
 
     async def disconnect(self) -> None:
-        """Disconnect the Telethon client."""
-        if self._client and self._connected:
-            await self._client.disconnect()
-            self._connected = False
-            logger.info("Telethon client disconnected")
+        """Detach from the shared client; disconnect when the last user leaves."""
+        if not self._client or not self._connected:
+            return
+
+        key = self._client_key
+        async with _shared_lock:
+            _shared_refcounts[key] -= 1
+            if _shared_refcounts[key] <= 0:
+                await self._client.disconnect()
+                _shared_clients.pop(key, None)
+                _shared_refcounts.pop(key, None)
+                logger.info("Telethon client disconnected")
+
+        self._client = None
+        self._connected = False
 
     def _extract_username(self, tg_link: str) -> str:
         """Extract the group/channel username from a t.me link."""
@@ -103,35 +150,48 @@ class TelegramAdminExtractor:
         # Start conservative: treat unknown/failed states as hidden.
         result = AdminResult(admins_hidden=True)
 
-        try:
-            # Resolve entity
-            entity = await self._client.get_entity(username)
-            logger.debug("Resolved entity: %s (type=%s)", username, type(entity).__name__)
-
-        except (
-            UsernameNotOccupiedError,
-            UsernameInvalidError,
-            ValueError,
-        ) as e:
-            logger.warning("Could not resolve Telegram entity %s: %s", username, e)
-            return result
-
-        except (ChannelPrivateError, ChannelInvalidError) as e:
-            logger.warning("Channel %s is private or invalid: %s", username, e)
-            return result
-
-        except (InviteHashExpiredError, InviteHashInvalidError) as e:
-            logger.warning("Invite link for %s is invalid: %s", username, e)
-            return result
-
-        except FloodWaitError as e:
-            logger.error("Telegram flood wait: %d seconds", e.seconds)
-            await asyncio.sleep(min(e.seconds, 60))
-            return result
-
-        except Exception as e:
-            logger.error("Unexpected error resolving %s: %s", username, e)
-            return result
+        username_key = username.lower()
+        entity = self._entity_cache.get(username_key)
+        if entity is not None:
+            self._entity_cache.move_to_end(username_key)
+            if entity is _BAD_ENTITY:
+                logger.debug("Skipping known-bad Telegram username %s", username)
+                return result
+        else:
+            try:
+                # Resolve entity
+                entity = await self._client.get_entity(username)
+                logger.debug(
+                    "Resolved entity: %s (type=%s)", username, type(entity).__name__
+                )
+                self._cache_entity(username_key, entity)
+
+            except (
+                UsernameNotOccupiedError,
+                UsernameInvalidError,
+                ValueError,
+            ) as e:
+                logger.warning("Could not resolve Telegram entity %s: %s", username, e)
+                self._cache_entity(username_key, _BAD_ENTITY)
+                return result
+
+            except (ChannelPrivateError, ChannelInvalidError) as e:
+                logger.warning("Channel %s is private or invalid: %s", username, e)
+                return result
+
+            except (InviteHashExpiredError, InviteHashInvalidError) as e:
+                logger.warning("Invite link for %s is invalid: %s", username, e)
+                self._cache_entity(username_key, _BAD_ENTITY)
+                return result
+
+            except FloodWaitError as e:
+                logger.error("Telegram flood wait: %d seconds", e.seconds)
+                await asyncio.sleep(min(e.seconds, 60))
+                return result
+
+            except Exception as e:
+                logger.error("Unexpected error resolving %s: %s", username, e)
+                return result
 
         # ── Get full channel info for description ──
         try:
@@ -147,19 +207,14 @@ class TelegramAdminExtractor:
             logger.debug("Could not get full info for %s: %s", username, e)
 
         # ── Get pinned message ──
+        # One filtered request instead of probing recent history; every
+        # extra call here risks FloodWaitError throttling.
         try:
-            pinned = await self._client.get_messages(entity, ids=None, limit=1)
+            pinned = await self._client.get_messages(
+                entity, filter=InputMessagesFilterPinned(), limit=1
+            )
             if pinned:
-                for msg in pinned:
-                    if msg and getattr(msg, "pinned", False):
-                        result.pinned_message_text = msg.text or ""
-                        break
-
-            # Alternative: iter pinned
-            async for msg in self._client.iter_messages(entity, limit=5):
-                if getattr(msg, "pinned", False):
-                    result.pinned_message_text = msg.text or ""
-                    break
+                result.pinned_message_text = pinned[0].text or ""
         except Exception as e:
             logger.debug("Could not get pinned message for %s: %s", username, e)
 
@@ -8,10 +8,33 @@ import asyncio
 import logging
 import sys
 import time
+from collections import deque
 from functools import wraps
 from typing import Any, Callable
 
 
+class _CachedTimeFormatter(logging.Formatter):
+    """
+    Formatter that renders the timestamp once per second.
+
+    The date format has second granularity, so records logged within the
+    same second — the common case during a busy poll — reuse the cached
+    string instead of paying strftime each time.
+    """
+
+    def __init__(self, fmt: str, datefmt: str):
+        super().__init__(fmt, datefmt=datefmt)
+        self._cached_key: tuple[int, str | None] | None = None
+        self._cached_asctime = ""
+
+    def formatTime(self, record: logging.LogRecord, datefmt: str | None = None) -> str:
+        key = (int(record.created), datefmt)
+        if key != self._cached_key:
+            self._cached_asctime = super().formatTime(record, datefmt)
+            self._cached_key = key
+        return self._cached_asctime
+
+
 def setup_logging(level: str = "INFO") -> logging.Logger:
     """Configure structured logging for the application."""
     logger = logging.getLogger("dexbot")
@@ -20,7 +43,7 @@ def setup_logging(level: str = "INFO") -> logging.Logger:
     if not logger.handlers:
         handler = logging.StreamHandler(sys.stdout)
         handler.setLevel(logging.DEBUG)
-        fmt = logging.Formatter(
+        fmt = _CachedTimeFormatter(
             "[%(asctime)s] %(levelname)-8s %(name)s | %(message)s",
             datefmt="%Y-%m-%d %H:%M:%S",
         )
@@ -43,27 +66,47 @@ class AsyncRateLimiter:
     def __init__(self, max_calls: int, period: float):
         self._max_calls = max_calls
         self._period = period
-        self._semaphore = asyncio.Semaphore(max_calls)
-        self._call_times: list[float] = []
+        self._call_times: deque[float] = deque()
         self._lock = asyncio.Lock()
 
-    async def __aenter__(self):
-        await self._semaphore.acquire()
+    async def acquire(self) -> None:
+        """
+        Reserve one call slot, sleeping only if the window is full.
+
+        The internal lock covers just the bookkeeping — the slot is reserved
+        before any sleep, and the sleep happens outside the lock — so waiting
+        here never serializes other callers, and the caller's subsequent I/O
+        runs outside any critical section.
+        """
         async with self._lock:
             now = time.monotonic()
-            # Remove expired timestamps
-            self._call_times = [t for t in self._call_times if now - t < self._period]
+            # Timestamps are appended in order, so expired entries sit at the
+            # front: pop them instead of rebuilding the whole list. Future
+            # reservations never satisfy the predicate and are kept.
+            while self._call_times and now - self._call_times[0] >= self._period:
+                self._call_times.popleft()
 
+            sleep_for = 0.0
             if len(self._call_times) >= self._max_calls:
-                sleep_for = self._period - (now - self._call_times[0])
-                if sleep_for > 0:
-                    await asyncio.sleep(sleep_for)
+                # Admit one period after the call max_calls back — with
+                # future reservations queued, the front entry may be several
+                # windows away from ours.
+                sleep_for = max(
+                    self._call_times[-self._max_calls] + self._period - now, 0.0
+                )
+            self._call_times.append(now + sleep_for)
 
-            self._call_times.append(time.monotonic())
+        if sleep_for > 0:
+            await asyncio.sleep(sleep_for)
+
+    async def __aenter__(self):
+        # The timestamp window alone enforces the call rate; an extra
+        # semaphore here would just add a second await per admission.
+        await self.acquire()
         return self
 
     async def __aexit__(self, *exc):
-        self._semaphore.release()
+        return None
 
 
 class RateLimiterGroup:
@@ -84,16 +127,13 @@ rate_limiters = RateLimiterGroup()
 
 def extract_domain(url: str) -> str:
     """Normalize a URL to its root domain only."""
-    from urllib.parse import urlparse
-
-    try:
-        parsed = urlparse(url)
-        domain = parsed.netloc or parsed.path
-        # Strip www. prefix
-        if domain.startswith("www."):
-            domain = domain[4:]
-        # Remove port if present
-        domain = domain.split(":")[0]
-        return domain.lower()
-    except Exception:
-        return ""
+    # Plain string ops instead of urlparse: schemes, queries and fragments
+    # are irrelevant here, and this runs per explorer/website URL.
+    if "://" in url:
+        url = url.split("://", 1)[1]
+    domain = url.split("/", 1)[0].split("?", 1)[0].split("#", 1)[0].lower()
+    # Strip www. prefix
+    if domain.startswith("www."):
+        domain = domain[4:]
+    # Remove port if present
+    return domain.split(":", 1)[0]
@@ -7,35 +7,350 @@ contract creation transaction.
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import Optional
+import random
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Optional
 
 import httpx
-from tenacity import retry, stop_after_attempt, wait_exponential
 
 from .config import Config
-from .utils import rate_limiters
+from .utils import extract_domain, rate_limiters
+
+# Large getSignaturesForAddress responses make JSON decode the CPU cost of
+# a Solana lookup; orjson parses straight from the response bytes.
+try:
+    import orjson
+
+    def _loads(resp: httpx.Response) -> Any:
+        return orjson.loads(resp.content)
+
+    def _dumps(payload: Any) -> bytes:
+        return orjson.dumps(payload)
+except ImportError:  # pragma: no cover - orjson is in requirements
+    import json as _json
+
+    def _loads(resp: httpx.Response) -> Any:
+        return resp.json()
+
+    def _dumps(payload: Any) -> bytes:
+        return _json.dumps(payload).encode()
 
 logger = logging.getLogger("dexbot.wallet")
 
+# Client config is identical for every instance; build it once.
+_DEFAULT_TIMEOUT = httpx.Timeout(15.0, connect=5.0)
+_DEFAULT_HEADERS = {"Accept": "application/json"}
+# One long-lived pool per explorer host, kept warm across polls; sized for
+# the raced creation/txlist pairs plus Solana batches, with HTTP/2
+# multiplexing where the endpoint offers it.
+_POOL_LIMITS = httpx.Limits(
+    max_connections=64,
+    max_keepalive_connections=32,
+    keepalive_expiry=75.0,
+)
+
+# Distinguishes "never looked up" from a cached negative result.
+_UNCACHED = object()
+
+
+# getTransaction account keys arrive as plain base58 strings or as
+# {"pubkey": ...} dicts depending on the RPC node's encoding. The shape is
+# constant per node, so the first successful parse pins one of these and
+# later transactions skip the isinstance dispatch. Each still checks its
+# own shape so a node switch degrades to a miss, not a wrong value.
+def _acc_from_str(first_acc: Any) -> Optional[str]:
+    return first_acc if isinstance(first_acc, str) else None
+
+
+def _acc_from_dict(first_acc: Any) -> Optional[str]:
+    return first_acc.get("pubkey") if isinstance(first_acc, dict) else None
+
+
+def _marks_unsupported(data: dict) -> bool:
+    """
+    True when an explorer reply says the endpoint itself is unsupported
+    (some L2 scanners lack the contract module), as opposed to a transient
+    NOTOK like a rate-limit rejection.
+    """
+    result = data.get("result")
+    return (
+        data.get("message") == "NOTOK"
+        and isinstance(result, str)
+        and ("module" in result.lower() or "action" in result.lower())
+    )
+
+# Static explorer query fragments, built (and stringified) once — per-call
+# dicts only add the keys that vary.
+_CREATION_PARAMS = {"module": "contract", "action": "getcontractcreation"}
+_TXLIST_PARAMS = {
+    "module": "account",
+    "action": "txlist",
+    "startblock": "0",
+    "endblock": "99999999",
+    "page": "1",
+    "offset": "1",
+    "sort": "asc",
+}
+
 
 class WalletLookup:
     """Look up the deployer wallet for a token contract."""
 
+    _CACHE_MAX = 5000
+    # A miss may just mean the explorer hasn't indexed the contract yet,
+    # so negatives are retried after a short while; hits never expire.
+    _NEGATIVE_TTL_SECONDS = 60.0
+
+    # Etherscan's getcontractcreation accepts up to five comma-separated
+    # addresses per call; lookups arriving within the window share one.
+    _BATCH_MAX = 5
+    _BATCH_WINDOW_SECONDS = 0.2
+
     def __init__(self, config: Config):
         self._config = config
+        # Deployers are immutable, so results are cached per (chain, address)
+        # to spare repeat explorer calls. Values are (deployer, expires_at);
+        # expires_at is None for positive results, which live forever.
+        self._cache: OrderedDict[
+            tuple[str, str], tuple[Optional[str], Optional[float]]
+        ] = OrderedDict()
+        # Per-chain queue of in-flight coalesced lookups: address -> future.
+        self._pending: dict[str, dict[str, asyncio.Future]] = {}
+        self._batch_timers: dict[str, asyncio.Task] = {}
+        # Strong references to in-flight batch tasks; a bare create_task
+        # result can be garbage-collected mid-flight, which would leave
+        # every future in the batch unresolved and its callers hung.
+        self._batch_tasks: set[asyncio.Task] = set()
+        # Pinned once the first Solana transaction parses successfully.
+        self._acc_parser: Optional[Callable[[Any], Optional[str]]] = None
+        # Per-explorer capability flags, set to False the first time an
+        # endpoint answers "module/action not supported" so later lookups
+        # skip the guaranteed-wasted round trip.
+        self._supports_creation: dict[str, bool] = {}
+        self._supports_txlist: dict[str, bool] = {}
+        # Config never changes after construction, so flatten the hot-path
+        # lookups once: (api_url, api_key) per usable chain, plus the RPC URL.
+        self._solana_rpc_url: Optional[str] = getattr(config, "solana_rpc_url", None)
+        self._explorers: dict[str, tuple[str, str]] = {
+            chain: (cfg["api_url"], cfg["api_key"])
+            for chain, cfg in config.explorer_configs.items()
+            if cfg.get("api_key")
+        }
         self._client = httpx.AsyncClient(
-            timeout=httpx.Timeout(15.0),
-            headers={"Accept": "application/json"},
+            http2=True,
+            timeout=_DEFAULT_TIMEOUT,
+            headers=_DEFAULT_HEADERS,
+            limits=_POOL_LIMITS,
         )
-        # Etherscan APIs: 5 calls/sec on free tier
-        self._limiter = rate_limiters.get("explorer", max_calls=4, period=1.0)
 
     async def close(self) -> None:
+        for timer in self._batch_timers.values():
+            timer.cancel()
+        self._batch_timers.clear()
+        for jobs in self._pending.values():
+            for future in jobs.values():
+                if not future.done():
+                    future.set_result(None)
+        self._pending.clear()
         await self._client.aclose()
 
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(min=2, max=10))
+    # Solana RPC nodes sustain far more than the Etherscan-family 5/sec,
+    # so the RPC host gets its own larger budget.
+    _SOLANA_RPC_CALLS_PER_SEC = 10
+
+    @staticmethod
+    def _limiter_for(url: str, max_calls: int = 5):
+        # Etherscan-compatible APIs allow ~5 calls/sec per key, per host.
+        # Keying the limiter by hostname lets etherscan/bscscan/basescan
+        # proceed in parallel instead of sharing one global bucket; the full
+        # 5-call budget lets the paired creation/txlist queries start together.
+        return rate_limiters.get(
+            f"explorer:{extract_domain(url)}", max_calls=max_calls, period=1.0
+        )
+
     async def get_deployer(self, chain: str, contract_address: str) -> Optional[str]:
+        """
+        Cached front door for _lookup_deployer. Returns the deployer wallet
+        for a contract, remembering both hits and misses per (chain, address).
+        """
+        key = (chain, contract_address)
+        cached = self._cache.get(key, _UNCACHED)
+        if cached is not _UNCACHED:
+            value, expires_at = cached
+            if expires_at is None or time.monotonic() < expires_at:
+                self._cache.move_to_end(key)
+                return value
+            del self._cache[key]
+
+        if self._can_batch(chain):
+            deployer = await self._enqueue_lookup(chain, contract_address)
+        else:
+            deployer = await self._lookup_deployer(chain, contract_address)
+        expires_at = None if deployer else time.monotonic() + self._NEGATIVE_TTL_SECONDS
+        self._cache[key] = (deployer, expires_at)
+        while len(self._cache) > self._CACHE_MAX:
+            self._cache.popitem(last=False)
+        return deployer
+
+    def _can_batch(self, chain: str) -> bool:
+        """Only Etherscan-family chains support multi-address creation lookups."""
+        return (
+            self._config.enable_wallet_lookup
+            and chain != "solana"
+            and chain in self._explorers
+        )
+
+    async def _enqueue_lookup(self, chain: str, contract_address: str) -> Optional[str]:
+        """
+        Coalesce this lookup with others for the same chain. The batch is
+        dispatched when it fills up or when the debounce window elapses, so
+        concurrent pipeline tasks share one explorer call.
+        """
+        pending = self._pending.setdefault(chain, {})
+        future = pending.get(contract_address)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            pending[contract_address] = future
+            if len(pending) >= self._BATCH_MAX:
+                self._dispatch_batch(chain)
+            elif chain not in self._batch_timers:
+                self._batch_timers[chain] = asyncio.create_task(
+                    self._batch_window(chain)
+                )
+        return await future
+
+    async def _batch_window(self, chain: str) -> None:
+        await asyncio.sleep(self._BATCH_WINDOW_SECONDS)
+        self._dispatch_batch(chain)
+
+    def _dispatch_batch(self, chain: str) -> None:
+        timer = self._batch_timers.pop(chain, None)
+        if timer is not None and timer is not asyncio.current_task():
+            timer.cancel()
+        jobs = self._pending.pop(chain, None)
+        if jobs:
+            task = asyncio.create_task(self._run_batch(chain, jobs))
+            self._batch_tasks.add(task)
+            task.add_done_callback(self._batch_tasks.discard)
+
+    async def _run_batch(self, chain: str, jobs: dict[str, asyncio.Future]) -> None:
+        try:
+            results = await self.get_deployers_batch(chain, list(jobs))
+        except Exception as e:
+            logger.warning("Deployer batch for %s failed: %s", chain, e)
+            results = {}
+        for address, future in jobs.items():
+            if not future.done():
+                future.set_result(results.get(address))
+
+    async def get_deployers_batch(
+        self, chain: str, addresses: list[str]
+    ) -> dict[str, Optional[str]]:
+        """
+        Resolve deployers for several contracts with as few explorer calls
+        as possible: one getcontractcreation per five addresses, then the
+        txlist fallback individually for whatever that misses.
+        """
+        entry = self._explorers.get(chain)
+        if entry is None:
+            return {}
+        api_url, api_key = entry
+
+        found: dict[str, Optional[str]] = {}
+        for start in range(0, len(addresses), self._BATCH_MAX):
+            chunk = addresses[start : start + self._BATCH_MAX]
+            found.update(await self._contract_creation_batch(api_url, api_key, chunk))
+
+        missing = [a for a in addresses if not found.get(a)]
+        if missing:
+            fallbacks = await asyncio.gather(
+                *(self._try_txlist_fallback(api_url, api_key, a) for a in missing),
+                return_exceptions=True,
+            )
+            for address, deployer in zip(missing, fallbacks):
+                found[address] = deployer if isinstance(deployer, str) else None
+        return found
+
+    async def _contract_creation_batch(
+        self, api_url: str, api_key: str, addresses: list[str]
+    ) -> dict[str, Optional[str]]:
+        """One getcontractcreation call for up to five addresses."""
+        if self._supports_creation.get(api_url) is False:
+            return {}
+        params = {
+            **_CREATION_PARAMS,
+            "contractaddresses": ",".join(addresses),
+            "apikey": api_key,
+        }
+        by_lower = {address.lower(): address for address in addresses}
+        found: dict[str, Optional[str]] = {}
+
+        try:
+            async with self._limiter_for(api_url):
+                resp = await self._client.get(api_url, params=params)
+                resp.raise_for_status()
+                data = _loads(resp)
+
+            if data.get("status") == "1" and isinstance(data.get("result"), list):
+                for entry in data["result"]:
+                    address = by_lower.get(str(entry.get("contractAddress", "")).lower())
+                    creator = entry.get("contractCreator", "")
+                    if address and creator:
+                        found[address] = creator
+                if found:
+                    logger.info(
+                        "Found %d/%d deployers via batched contractcreation",
+                        len(found),
+                        len(addresses),
+                    )
+            elif _marks_unsupported(data):
+                logger.info("%s does not support getcontractcreation", api_url)
+                self._supports_creation[api_url] = False
+        except Exception as e:
+            logger.debug("batched contractcreation lookup failed: %s", e)
+
+        return found
+
+    # Retry policy for a full lookup: each attempt runs under its own
+    # deadline (growing per attempt so a slow explorer still gets a fair
+    # shot), and the jittered backoff keeps retrying tasks from piling
+    # onto the shared per-host rate bucket in lockstep.
+    _LOOKUP_MAX_ATTEMPTS = 3
+    _LOOKUP_BASE_TIMEOUT = 4.0
+    _LOOKUP_TIMEOUT_STEP = 2.0
+
+    async def _lookup_deployer(self, chain: str, contract_address: str) -> Optional[str]:
+        """
+        Retrying wrapper around _lookup_deployer_once. A hung request is
+        cancelled at the attempt deadline instead of holding the pipeline
+        for the full 15 s client timeout; exhausted retries degrade to None
+        like every other failure in this module.
+        """
+        for attempt in range(self._LOOKUP_MAX_ATTEMPTS):
+            try:
+                async with asyncio.timeout(
+                    self._LOOKUP_BASE_TIMEOUT + attempt * self._LOOKUP_TIMEOUT_STEP
+                ):
+                    return await self._lookup_deployer_once(chain, contract_address)
+            except Exception as e:
+                if attempt == self._LOOKUP_MAX_ATTEMPTS - 1:
+                    logger.warning(
+                        "Deployer lookup failed for %s/%s after %d attempts: %s",
+                        chain,
+                        contract_address,
+                        self._LOOKUP_MAX_ATTEMPTS,
+                        e,
+                    )
+                    return None
+                await asyncio.sleep(2**attempt * (0.5 + random.random()))
+        return None
+
+    async def _lookup_deployer_once(
+        self, chain: str, contract_address: str
+    ) -> Optional[str]:
         """
         Query the block explorer to find the deployer (contract creator) wallet.
 
@@ -56,26 +371,113 @@ class WalletLookup:
         if chain == "solana":
             return await self._get_solana_deployer(contract_address)
 
-        explorer = self._config.explorer_configs.get(chain)
-        if not explorer:
-            logger.warning("No explorer config for chain: %s", chain)
+        entry = self._explorers.get(chain)
+        if entry is None:
+            if chain not in self._config.explorer_configs:
+                logger.warning("No explorer config for chain: %s", chain)
+            else:
+                logger.warning(
+                    "No API key for %s explorer — skipping wallet lookup", chain
+                )
             return None
+        api_url, api_key = entry
+
+        # ── Methods 1+2: contractcreation and txlist, raced together ──
+        # Both are independent queries against the same explorer, and the
+        # txlist fallback fires often for fresh deployments. Running them
+        # concurrently spends one extra explorer call when contractcreation
+        # alone would have sufficed, but halves wall time when it misses;
+        # contractcreation (the more reliable endpoint) wins if both answer.
+        creation, fallback = await asyncio.gather(
+            self._try_contract_creation(api_url, api_key, contract_address),
+            self._try_txlist_fallback(api_url, api_key, contract_address),
+        )
+        return creation or fallback
+
+    async def _solana_rpc(self, rpc_url: str, payloads: list[dict]) -> list[dict]:
+        """
+        POST one or more JSON-RPC requests in a single HTTP round trip.
 
-        api_url = explorer["api_url"]
-        api_key = explorer["api_key"]
+        Solana RPC accepts array-form batches natively, so several requests
+        share one POST and one rate-limiter slot. Responses are returned
+        ordered by request id (batch responses may arrive in any order).
+        """
+        body = payloads[0] if len(payloads) == 1 else payloads
+        async with self._limiter_for(rpc_url, max_calls=self._SOLANA_RPC_CALLS_PER_SEC):
+            resp = await self._client.post(
+                rpc_url,
+                content=_dumps(body),
+                headers={"Content-Type": "application/json"},
+            )
+            resp.raise_for_status()
+            data = _loads(resp)
+        if isinstance(data, dict):
+            return [data]
+        data.sort(key=lambda item: item.get("id", 0))
+        return data
+
+    # Fresh tokens rarely have deep histories, so page in small chunks and
+    # walk back with `before` only when a page comes back full; the cap
+    # bounds worst-case work on unexpectedly busy mints.
+    _SIG_PAGE_LIMIT = 100
+    _SIG_MAX_PAGES = 5
+
+    # Payload templates: only `id` and `params` vary per call, so clone a
+    # prebuilt dict instead of respelling the constant fields. The option
+    # dicts are shared across payloads — _dumps only reads them, and the
+    # `before` variant (the rare path) gets a fresh dict of its own.
+    _SIG_TEMPLATE = {"jsonrpc": "2.0", "id": 0, "method": "getSignaturesForAddress"}
+    _SIG_BASE_OPTS = {"limit": _SIG_PAGE_LIMIT}
+    _TX_TEMPLATE = {"jsonrpc": "2.0", "id": 0, "method": "getTransaction"}
+    _TX_OPTS = {"maxSupportedTransactionVersion": 0}
+
+    @staticmethod
+    def _sig_payload(
+        request_id: int, token_address: str, before: Optional[str] = None
+    ) -> dict:
+        if before:
+            opts: dict = {"limit": WalletLookup._SIG_PAGE_LIMIT, "before": before}
+        else:
+            opts = WalletLookup._SIG_BASE_OPTS
+        payload = dict(WalletLookup._SIG_TEMPLATE)
+        payload["id"] = request_id
+        payload["params"] = [token_address, opts]
+        return payload
+
+    @staticmethod
+    def _tx_payload(request_id: int, signature: str) -> dict:
+        payload = dict(WalletLookup._TX_TEMPLATE)
+        payload["id"] = request_id
+        payload["params"] = [signature, WalletLookup._TX_OPTS]
+        return payload
 
-        if not api_key:
-            logger.warning("No API key for %s explorer — skipping wallet lookup", chain)
+    def _parse_solana_deployer(self, data_tx: dict) -> Optional[str]:
+        """Extract the fee payer / first signer from a getTransaction response."""
+        tx_result = data_tx.get("result") or {}
+        if not tx_result:
             return None
 
-        # ── Method 1: contractcreation endpoint (most reliable) ──
-        deployer = await self._try_contract_creation(api_url, api_key, contract_address)
-        if deployer:
-            return deployer
+        # Parse deployer: usually the first account in output, which is the
+        # fee payer/signer. In `getTransaction`,
+        # `transaction.message.accountKeys` contains the accounts.
+        transaction = tx_result.get("transaction", {})
+        message = transaction.get("message", {})
+        account_keys = message.get("accountKeys", [])
 
-        # ── Method 2: txlist for the contract (fallback) ──
-        deployer = await self._try_txlist_fallback(api_url, api_key, contract_address)
-        return deployer
+        if not account_keys:
+            return None
+        first_acc = account_keys[0]
+        if self._acc_parser is not None:
+            return self._acc_parser(first_acc)
+        # First time through: detect the format (list of strings vs list of
+        # dicts) and pin the matching parser for the rest of the run.
+        if isinstance(first_acc, str):
+            self._acc_parser = _acc_from_str
+            return first_acc
+        if isinstance(first_acc, dict):
+            self._acc_parser = _acc_from_dict
+            return first_acc.get("pubkey")
+        return None
 
     async def _get_solana_deployer(self, token_address: str) -> Optional[str]:
         """
@@ -83,116 +485,79 @@ class WalletLookup:
         Strategy:
         1. getSignaturesForAddress(token_address, limit=1000) -> oldest signature (mint tx)
            Note: We want the *first* transaction (minting). getSignaturesForAddress returns newest first.
-           We can walk back the history or, for simplicity in MVP, just try to get the very last item 
-           if we assume the token is relatively new and hasn't had thousands of txs yet.
-           However, for high volume tokens this might miss the creation.
-           Better approach for MVP: getSignaturesForAddress with `before` param, or just get the last one 
-           from a large limit if the token is new (which it is, per our freshness filter).
+           Since we filter for tokens < 15 mins old, the last item of a large
+           batch is usually the mint; high-volume tokens would need `before`
+           pagination to be exact.
         2. getTransaction(signature) -> extract fee payer / first signer.
+
+        The second call depends on the first's result, so the two cannot
+        share a JSON-RPC batch — but both go through _solana_rpc, which lets
+        callers batch the signature fetches of several tokens into one POST.
         """
-        rpc_url = getattr(self._config, "solana_rpc_url", None)
+        rpc_url = self._solana_rpc_url
         if not rpc_url:
             return None
 
-        # 1. Fetch signatures (history).
-        # Since we filter for tokens < 15 mins old, 1000 txs might be enough to reach the bottom (creation).
-        # If not, we'd need to paginate. For MVP, we'll take the last one from the batch.
         try:
-            payload = {
-                "jsonrpc": "2.0",
-                "id": 1,
-                "method": "getSignaturesForAddress",
-                "params": [
-                    token_address,
-                    {"limit": 1000} 
-                ]
-            }
-            async with self._limiter: # Reuse limiter or create new one? 
-                # Note: Ethereum limiter is 5/sec. Solana public RPC has different limits.
-                # We'll use the same limiter to avoid spamming too hard generally, 
-                # although ideally we'd have a separate one.
-                resp = await self._client.post(rpc_url, json=payload)
-                resp.raise_for_status()
-                data = resp.json()
-            
-            if "error" in data:
-                logger.warning("Solana RPC error (sigs): %s", data["error"])
-                return None
-            
-            result = data.get("result", [])
+            before: Optional[str] = None
+            result: list = []
+            for _ in range(self._SIG_MAX_PAGES):
+                data = (
+                    await self._solana_rpc(
+                        rpc_url, [self._sig_payload(1, token_address, before)]
+                    )
+                )[0]
+                if "error" in data:
+                    logger.warning("Solana RPC error (sigs): %s", data["error"])
+                    return None
+                page = data.get("result", [])
+                if not page:
+                    break
+                result = page
+                if len(page) < self._SIG_PAGE_LIMIT:
+                    # Short page means we reached the start of the history.
+                    break
+                before = page[-1]["signature"]
+
             if not result:
                 return None
-            
+
             # The last signature in the list is the oldest returned.
             # Ideally this is the mint transaction for a new token.
             creation_tx_sig = result[-1]["signature"]
-            
-            # 2. Fetch transaction details
-            payload_tx = {
-                "jsonrpc": "2.0",
-                "id": 2,
-                "method": "getTransaction",
-                "params": [
-                    creation_tx_sig,
-                    {"maxSupportedTransactionVersion": 0}
-                ]
-            }
-            
-            async with self._limiter:
-                resp = await self._client.post(rpc_url, json=payload_tx)
-                resp.raise_for_status()
-                data_tx = resp.json()
-                
+
+            data_tx = (await self._solana_rpc(rpc_url, [self._tx_payload(2, creation_tx_sig)]))[0]
             if "error" in data_tx:
                 logger.warning("Solana RPC error (tx): %s", data_tx["error"])
                 return None
-            
-            tx_result = data_tx.get("result", {})
-            if not tx_result:
-                return None
-                
-            # Parse deployer: usually the first account in output, which is the fee payer/signer.
-            # In `getTransaction`, `transaction.message.accountKeys` contains the accounts.
-            # If it's a versioned tx, parsing is slightly different but usually the first account is signer.
-            
-            transaction = tx_result.get("transaction", {})
-            message = transaction.get("message", {})
-            account_keys = message.get("accountKeys", [])
-            
-            deployer = None
-            if account_keys:
-                # Check format: sometimes it's a list of strings, sometimes list of dicts
-                first_acc = account_keys[0]
-                if isinstance(first_acc, str):
-                    deployer = first_acc
-                elif isinstance(first_acc, dict):
-                    deployer = first_acc.get("pubkey")
-            
+
+            deployer = self._parse_solana_deployer(data_tx)
             if deployer:
                 logger.info("Found Solana deployer: %s", deployer)
                 return deployer
 
         except Exception as e:
             logger.debug("Solana deployer lookup failed: %s", e)
-            
+
         return None
 
     async def _try_contract_creation(
         self, api_url: str, api_key: str, contract_address: str
     ) -> Optional[str]:
         """Try the getcontractcreation endpoint."""
+        if self._supports_creation.get(api_url) is False:
+            return None
         params = {
-            "module": "contract",
-            "action": "getcontractcreation",
+            **_CREATION_PARAMS,
             "contractaddresses": contract_address,
             "apikey": api_key,
         }
 
         try:
-            async with self._limiter:
+            async with self._limiter_for(api_url):
                 resp = await self._client.get(api_url, params=params)
                 resp.raise_for_status()
-                data = resp.json()
+                data = _loads(resp)
 
             if data.get("status") == "1" and data.get("result"):
                 result = data["result"]
@@ -203,6 +568,9 @@ class WalletLookup:
                             "Found deployer via contractcreation: %s", creator[:10] + "…"
                         )
                         return creator
+            elif _marks_unsupported(data):
+                logger.info("%s does not support getcontractcreation", api_url)
+                self._supports_creation[api_url] = False
         except Exception as e:
             logger.debug("contractcreation lookup failed: %s", e)
 
@@ -212,23 +580,19 @@ class WalletLookup:
         self, api_url: str, api_key: str, contract_address: str
     ) -> Optional[str]:
         """Fallback: look up earliest internal/normal tx to the contract."""
+        if self._supports_txlist.get(api_url) is False:
+            return None
         params = {
-            "module": "account",
-            "action": "txlist",
+            **_TXLIST_PARAMS,
             "address": contract_address,
-            "startblock": 0,
-            "endblock": 99999999,
-            "page": 1,
-            "offset": 1,
-            "sort": "asc",
             "apikey": api_key,
         }
 
         try:
-            async with self._limiter:
+            async with self._limiter_for(api_url):
                 resp = await self._client.get(api_url, params=params)
                 resp.raise_for_status()
-                data = resp.json()
+                data = _loads(resp)
 
             if data.get("status") == "1" and data.get("result"):
                 result = data["result"]
@@ -246,6 +610,9 @@ class WalletLookup:
                     deployer = tx.get("from", "")
                     if deployer:
                         return deployer
+            elif _marks_unsupported(data):
+                logger.info("%s does not support txlist", api_url)
+                self._supports_txlist[api_url] = False
         except Exception as e:
             logger.debug("txlist fallback failed: %s", e)
 
@@ -11,7 +11,7 @@ except ModuleNotFoundError:  # pragma: no cover - environment dependent
 
 @unittest.skipIf(
     DexscreenerClient is None,
-    "Dexscreener tests require project dependencies (httpx/pydantic/tenacity).",
+    "Dexscreener tests require project dependencies (httpx/tenacity).",
 )
 class DexscreenerParserTests(unittest.TestCase):
     def test_parse_pair_valid(self) -> None:
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import asyncio
-from collections import Counter
 from datetime import datetime, timedelta, timezone
 import os
 import tempfile
@@ -17,12 +16,20 @@ except ModuleNotFoundError:  # pragma: no cover - environment dependent
 
 
 class _FlakyNotifier:
-    def __init__(self) -> None:
+    """
+    Stands in for the background sender: fails the first send, then
+    succeeds, delivering each outcome through the bot's result callback
+    the way Notifier's worker does.
+    """
+
+    def __init__(self, bot: LeadBot) -> None:
+        self._bot = bot
         self._calls = 0
 
-    async def send_lead(self, _lead: LeadRecord) -> bool:
-        self._calls += 1
-        return self._calls >= 2
+    async def enqueue_leads(self, leads: list[LeadRecord]) -> None:
+        for lead in leads:
+            self._calls += 1
+            await self._bot._on_notify_result(lead, self._calls >= 2)
 
 
 @unittest.skipIf(
@@ -47,7 +54,7 @@ class NotificationRetryFlowTests(unittest.IsolatedAsyncioTestCase):
 
             with patch.dict(os.environ, env, clear=False):
                 bot = LeadBot()
-                bot._notifier = _FlakyNotifier()
+                bot._notifier = _FlakyNotifier(bot)
                 try:
                     try:
                         await asyncio.wait_for(bot._db.connect(), timeout=3)
@@ -68,10 +75,11 @@ class NotificationRetryFlowTests(unittest.IsolatedAsyncioTestCase):
                     )
                     await bot._db.insert_lead(lead)
 
-                    poll_metrics: Counter[str] = Counter()
-                    await bot._retry_pending_notifications(poll_metrics)
-                    self.assertEqual(poll_metrics["retried_notify_failed"], 1)
-                    self.assertEqual(poll_metrics["notify_retry_scheduled"], 1)
+                    # Outcomes arrive via _on_notify_result after the poll,
+                    # so the counters land in the lifetime metrics.
+                    await bot._retry_pending_notifications()
+                    self.assertEqual(bot._metrics["retried_notify_failed"], 1)
+                    self.assertEqual(bot._metrics["notify_retry_scheduled"], 1)
 
                     assert bot._db._conn is not None
                     await bot._db._conn.execute(
@@ -86,8 +94,8 @@ class NotificationRetryFlowTests(unittest.IsolatedAsyncioTestCase):
                     )
                     await bot._db._conn.commit()
 
-                    await bot._retry_pending_notifications(poll_metrics)
-                    self.assertEqual(poll_metrics["retried_notified"], 1)
+                    await bot._retry_pending_notifications()
+                    self.assertEqual(bot._metrics["retried_notified"], 1)
 
                     row = await (
                         await bot._db._conn.execute(